@@ -7,38 +7,49 @@ Complete examples demonstrating all major features
 Get your API key from: https://console.oomol.com/api-key
 """
 
-from pdf_craft_sdk import PDFCraftClient, FormatType, UploadProgress, PollingStrategy
-from pdf_craft_sdk.exceptions import APIError
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Replace with your API key from https://console.oomol.com/api-key
 API_KEY = "your_api_key_here"
 
 
-def example_1_basic_conversion():
+def example_1_basic_conversion(client):
     """Example 1: Basic local PDF conversion"""
     print("\n" + "="*60)
     print("Example 1: Basic Local PDF Conversion")
     print("="*60)
 
-    client = PDFCraftClient(api_key=API_KEY)
-
     # Simple one-line conversion
     download_url = client.convert_local_pdf("document.pdf")
     print(f"✅ Conversion successful! Download URL: {download_url}")
 
 
-def example_2_with_progress():
+def example_2_with_progress(client):
     """Example 2: Upload with progress tracking"""
+    from pdf_craft_sdk import UploadProgress
+
     print("\n" + "="*60)
     print("Example 2: Upload with Progress Tracking")
     print("="*60)
 
+    # Print at most every 100ms or every 5%, so large files with many parts
+    # don't flood the terminal
+    last_time = 0.0
+    last_percentage = -100.0
+
     def on_progress(progress: UploadProgress):
-        print(f"📤 Upload progress: {progress.percentage:.2f}% "
+        nonlocal last_time, last_percentage
+        now = time.monotonic()
+        if (progress.percentage < 100
+                and now - last_time < 0.1
+                and progress.percentage - last_percentage < 5):
+            return
+        last_time, last_percentage = now, progress.percentage
+        print(f"📤 [{progress.render_bar()}] {progress.percentage:.2f}% "
               f"({progress.current_part}/{progress.total_parts} parts)")
 
-    client = PDFCraftClient(api_key=API_KEY)
-
     download_url = client.convert_local_pdf(
         "large_document.pdf",
         progress_callback=on_progress
@@ -46,14 +57,14 @@ def example_2_with_progress():
     print(f"✅ Download URL: {download_url}")
 
 
-def example_3_epub_conversion():
+def example_3_epub_conversion(client):
     """Example 3: Convert to EPUB format"""
+    from pdf_craft_sdk import FormatType
+
     print("\n" + "="*60)
     print("Example 3: Convert to EPUB Format")
     print("="*60)
 
-    client = PDFCraftClient(api_key=API_KEY)
-
     download_url = client.convert_local_pdf(
         "document.pdf",
         format_type=FormatType.EPUB,
@@ -62,14 +73,14 @@ def example_3_epub_conversion():
     print(f"✅ EPUB file ready: {download_url}")
 
 
-def example_4_manual_steps():
+def example_4_manual_steps(client):
     """Example 4: Manual upload and conversion (step by step)"""
+    from pdf_craft_sdk import FormatType
+
     print("\n" + "="*60)
     print("Example 4: Manual Upload and Conversion")
     print("="*60)
 
-    client = PDFCraftClient(api_key=API_KEY)
-
     # Step 1: Upload file
     print("Step 1: Uploading file...")
     cache_url = client.upload_file("document.pdf")
@@ -86,14 +97,14 @@ def example_4_manual_steps():
     print(f"✅ Download URL: {download_url}")
 
 
-def example_5_remote_pdf():
+def example_5_remote_pdf(client):
     """Example 5: Convert remote PDF (HTTPS URL)"""
+    from pdf_craft_sdk import FormatType
+
     print("\n" + "="*60)
     print("Example 5: Convert Remote PDF")
     print("="*60)
 
-    client = PDFCraftClient(api_key=API_KEY)
-
     # If you already have a HTTPS URL from upload API
     pdf_url = "https://oomol-file-cache.example.com/your-file.pdf"
 
@@ -101,14 +112,14 @@ def example_5_remote_pdf():
     print(f"✅ Download URL: {download_url}")
 
 
-def example_6_custom_polling():
+def example_6_custom_polling(client):
     """Example 6: Custom polling strategy"""
+    from pdf_craft_sdk import PollingStrategy
+
     print("\n" + "="*60)
     print("Example 6: Custom Polling Strategy")
     print("="*60)
 
-    client = PDFCraftClient(api_key=API_KEY)
-
     # Stable polling every 3 seconds
     download_url = client.convert_local_pdf(
         "document.pdf",
@@ -128,14 +139,14 @@ def example_6_custom_polling():
     print(f"✅ Download URL: {download_url}")
 
 
-def example_7_error_handling():
+def example_7_error_handling(client):
     """Example 7: Proper error handling"""
+    from pdf_craft_sdk import APIError, TimeoutError
+
     print("\n" + "="*60)
     print("Example 7: Error Handling")
     print("="*60)
 
-    client = PDFCraftClient(api_key=API_KEY)
-
     try:
         download_url = client.convert_local_pdf("document.pdf")
         print(f"✅ Success: {download_url}")
@@ -149,60 +160,70 @@ def example_7_error_handling():
         print(f"❌ Unexpected error: {e}")
 
 
-def example_8_batch_processing():
+def example_8_batch_processing(client):
     """Example 8: Batch processing multiple files"""
     print("\n" + "="*60)
     print("Example 8: Batch Processing")
     print("="*60)
 
-    client = PDFCraftClient(api_key=API_KEY)
-
     pdf_files = ["doc1.pdf", "doc2.pdf", "doc3.pdf"]
 
-    # Submit all tasks without waiting
+    # Upload and submit in parallel, without exceeding the server's concurrency limit
+    max_workers = max(1, min(len(pdf_files), client.get_concurrent_status().max_concurrent_jobs))
     task_ids = []
-    for pdf_file in pdf_files:
-        try:
-            print(f"📄 Processing {pdf_file}...")
-            task_id = client.convert_local_pdf(pdf_file, wait=False)
-            task_ids.append((pdf_file, task_id))
-            print(f"✅ Task submitted: {task_id}")
-        except Exception as e:
-            print(f"❌ Error processing {pdf_file}: {e}")
-
-    # Wait for all tasks to complete
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(client.convert_local_pdf, pdf_file, wait=False): pdf_file
+            for pdf_file in pdf_files
+        }
+        for future in as_completed(futures):
+            pdf_file = futures[future]
+            try:
+                task_id = future.result()
+                task_ids.append((pdf_file, task_id))
+                print(f"✅ {pdf_file} submitted: {task_id}")
+            except Exception as e:
+                print(f"❌ Error processing {pdf_file}: {e}")
+
+    # Wait for all tasks in parallel and report them in completion order,
+    # so a fast task is not held up behind a slow one
     print("\n⏳ Waiting for all tasks to complete...")
-    for pdf_file, task_id in task_ids:
-        try:
-            download_url = client.wait_for_completion(task_id)
-            print(f"✅ {pdf_file}: {download_url}")
-        except Exception as e:
-            print(f"❌ {pdf_file} failed: {e}")
+    with ThreadPoolExecutor(max_workers=max(1, len(task_ids))) as executor:
+        futures = {
+            executor.submit(client.wait_for_completion, task_id): pdf_file
+            for pdf_file, task_id in task_ids
+        }
+        for future in as_completed(futures):
+            pdf_file = futures[future]
+            try:
+                print(f"✅ {pdf_file}: {future.result()}")
+            except Exception as e:
+                print(f"❌ {pdf_file} failed: {e}")
 
 
-def example_9_custom_endpoint():
+def example_9_custom_endpoint(client):
     """Example 9: Using custom upload endpoint"""
+    from pdf_craft_sdk import PDFCraftClient
+
     print("\n" + "="*60)
     print("Example 9: Custom Upload Endpoint")
     print("="*60)
 
-    client = PDFCraftClient(
-        api_key=API_KEY,
+    # A custom endpoint needs its own client
+    with PDFCraftClient(
+        api_key=client.api_key,
         upload_base_url="https://custom.example.com/upload"
-    )
-
-    download_url = client.convert_local_pdf("document.pdf")
+    ) as custom_client:
+        download_url = custom_client.convert_local_pdf("document.pdf")
     print(f"✅ Download URL: {download_url}")
 
 
-def example_10_async_workflow():
+def example_10_async_workflow(client):
     """Example 10: Async workflow (submit now, check later)"""
     print("\n" + "="*60)
     print("Example 10: Async Workflow")
     print("="*60)
 
-    client = PDFCraftClient(api_key=API_KEY)
-
     # Submit and get task ID immediately
     task_id = client.convert_local_pdf("document.pdf", wait=False)
     print(f"✅ Task submitted: {task_id}")
@@ -214,6 +235,86 @@ def example_10_async_workflow():
     print(f"✅ Download URL: {download_url}")
 
 
+def example_11_batch_api(client):
+    """Example 11: Convert multiple files as one server-side batch"""
+    from pdf_craft_sdk import BatchDetail, JobStatus
+
+    print("\n" + "="*60)
+    print("Example 11: Batch API")
+    print("="*60)
+
+    pdf_files = ["doc1.pdf", "doc2.pdf", "doc3.pdf"]
+
+    # Upload all files, then create and start a single batch
+    batch = client.convert_files(pdf_files)
+    print(f"✅ Batch started: {batch.batch_id} ({batch.total_files} files)")
+
+    # Wait for the batch to reach a terminal state.
+    # The SDK polls densely while files keep completing and backs off otherwise.
+    def on_batch_progress(batch_detail: BatchDetail):
+        print(f"📊 {batch_detail.status}: {batch_detail.completed_files}/{batch_detail.total_files} files "
+              f"({batch_detail.progress}%)")
+
+    print("\n⏳ Waiting for the batch to finish...")
+    client.wait_for_batch(batch.batch_id, progress_callback=on_batch_progress)
+
+    # Collect the results
+    for job in client.iter_batch_jobs(batch.batch_id):
+        if job.status == JobStatus.COMPLETED.value:
+            print(f"✅ {job.file_name}: {job.result_url}")
+        else:
+            print(f"❌ {job.file_name}: {job.error_message or job.status}")
+
+
+async def example_12_asyncio_concurrency(client):
+    """Example 12: Process multiple files concurrently with asyncio"""
+    from pdf_craft_sdk import AsyncPDFCraftClient
+
+    print("\n" + "="*60)
+    print("Example 12: Asyncio Concurrency")
+    print("="*60)
+
+    # The async client shares the sync client's connection pool
+    async_client = AsyncPDFCraftClient.from_client(client)
+
+    pdf_files = ["doc1.pdf", "doc2.pdf", "doc3.pdf"]
+
+    # Upload and submit all files concurrently
+    print(f"📄 Submitting {len(pdf_files)} files...")
+    submissions = await asyncio.gather(
+        *(async_client.convert_local_pdf(pdf_file, wait=False) for pdf_file in pdf_files),
+        return_exceptions=True
+    )
+
+    task_ids = []
+    for pdf_file, result in zip(pdf_files, submissions):
+        if isinstance(result, Exception):
+            print(f"❌ Error processing {pdf_file}: {result}")
+        else:
+            task_ids.append((pdf_file, result))
+            print(f"✅ {pdf_file} submitted: {result}")
+
+    # Wait for all tasks concurrently
+    print("\n⏳ Waiting for all tasks to complete...")
+    results = await asyncio.gather(
+        *(async_client.wait_for_completion(task_id) for _, task_id in task_ids),
+        return_exceptions=True
+    )
+
+    for (pdf_file, _), result in zip(task_ids, results):
+        if isinstance(result, Exception):
+            print(f"❌ {pdf_file} failed: {result}")
+        else:
+            print(f"✅ {pdf_file}: {result}")
+
+
+def run_example(func, client):
+    """Run an example, driving coroutine examples with asyncio"""
+    result = func(client)
+    if asyncio.iscoroutine(result):
+        asyncio.run(result)
+
+
 def main():
     """Run all examples"""
     print("\n" + "="*60)
@@ -238,6 +339,8 @@ def main():
         ("Batch Processing", example_8_batch_processing),
         ("Custom Endpoint", example_9_custom_endpoint),
         ("Async Workflow", example_10_async_workflow),
+        ("Batch API", example_11_batch_api),
+        ("Asyncio Concurrency", example_12_asyncio_concurrency),
     ]
 
     print("\nAvailable examples:")
@@ -245,21 +348,28 @@ def main():
         print(f"  {i}. {name}")
 
     print("\n" + "="*60)
-    choice = input("\nEnter example number (1-10) or 'all' to run all: ").strip().lower()
+    choice = input("\nEnter example number (1-12) or 'all' to run all: ").strip().lower()
 
     if choice == 'all':
-        for name, func in examples:
-            try:
-                func()
-            except Exception as e:
-                print(f"\n❌ Example failed: {e}")
+        selected = examples
     elif choice.isdigit() and 1 <= int(choice) <= len(examples):
-        try:
-            examples[int(choice) - 1][1]()
-        except Exception as e:
-            print(f"\n❌ Example failed: {e}")
+        selected = [examples[int(choice) - 1]]
     else:
         print("❌ Invalid choice")
+        selected = []
+
+    if selected:
+        # Import the SDK only once an example has been chosen
+        from pdf_craft_sdk import PDFCraftClient
+
+        # One client is shared by all examples so its connection pool stays warm;
+        # the with block closes it once they finish
+        with PDFCraftClient(api_key=API_KEY) as client:
+            for name, func in selected:
+                try:
+                    run_example(func, client)
+                except Exception as e:
+                    print(f"\n❌ Example failed: {e}")
 
     print("\n" + "="*60)
     print("Done!")
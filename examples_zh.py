@@ -7,38 +7,48 @@ PDF Craft SDK - 使用示例
 从这里获取你的 API 密钥: https://console.oomol.com/api-key
 """
 
-from pdf_craft_sdk import PDFCraftClient, FormatType, UploadProgress, PollingStrategy
-from pdf_craft_sdk.exceptions import APIError
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # 请将下方替换为你从 https://console.oomol.com/api-key 获取的 API 密钥
 API_KEY = "your_api_key_here"
 
 
-def example_1_basic_conversion():
+def example_1_basic_conversion(client):
     """示例 1: 基础本地 PDF 转换"""
     print("\n" + "="*60)
     print("示例 1: 基础本地 PDF 转换")
     print("="*60)
 
-    client = PDFCraftClient(api_key=API_KEY)
-
     # 简单的一行转换
     download_url = client.convert_local_pdf("document.pdf")
     print(f"✅ 转换成功! 下载链接: {download_url}")
 
 
-def example_2_with_progress():
+def example_2_with_progress(client):
     """示例 2: 带进度追踪的上传"""
+    from pdf_craft_sdk import UploadProgress
+
     print("\n" + "="*60)
     print("示例 2: 带进度追踪的上传")
     print("="*60)
 
+    # 最多每 100 毫秒或每 5% 输出一次，避免分片很多的大文件刷屏
+    last_time = 0.0
+    last_percentage = -100.0
+
     def on_progress(progress: UploadProgress):
-        print(f"📤 上传进度: {progress.percentage:.2f}% "
+        nonlocal last_time, last_percentage
+        now = time.monotonic()
+        if (progress.percentage < 100
+                and now - last_time < 0.1
+                and progress.percentage - last_percentage < 5):
+            return
+        last_time, last_percentage = now, progress.percentage
+        print(f"📤 [{progress.render_bar()}] {progress.percentage:.2f}% "
               f"({progress.current_part}/{progress.total_parts} 分片)")
 
-    client = PDFCraftClient(api_key=API_KEY)
-
     download_url = client.convert_local_pdf(
         "large_document.pdf",
         progress_callback=on_progress
@@ -46,14 +56,14 @@ def example_2_with_progress():
     print(f"✅ 下载链接: {download_url}")
 
 
-def example_3_epub_conversion():
+def example_3_epub_conversion(client):
     """示例 3: 转换为 EPUB 格式"""
+    from pdf_craft_sdk import FormatType
+
     print("\n" + "="*60)
     print("示例 3: 转换为 EPUB 格式")
     print("="*60)
 
-    client = PDFCraftClient(api_key=API_KEY)
-
     download_url = client.convert_local_pdf(
         "document.pdf",
         format_type=FormatType.EPUB,
@@ -62,14 +72,14 @@ def example_3_epub_conversion():
     print(f"✅ EPUB 文件已就绪: {download_url}")
 
 
-def example_4_manual_steps():
+def example_4_manual_steps(client):
     """示例 4: 手动上传和转换 (分步操作)"""
+    from pdf_craft_sdk import FormatType
+
     print("\n" + "="*60)
     print("示例 4: 手动上传和转换")
     print("="*60)
 
-    client = PDFCraftClient(api_key=API_KEY)
-
     # 步骤 1: 上传文件
     print("步骤 1: 正在上传文件...")
     cache_url = client.upload_file("document.pdf")
@@ -86,14 +96,14 @@ def example_4_manual_steps():
     print(f"✅ 下载链接: {download_url}")
 
 
-def example_5_remote_pdf():
+def example_5_remote_pdf(client):
     """示例 5: 转换远程 PDF (HTTPS URL)"""
+    from pdf_craft_sdk import FormatType
+
     print("\n" + "="*60)
     print("示例 5: 转换远程 PDF")
     print("="*60)
 
-    client = PDFCraftClient(api_key=API_KEY)
-
     # 如果你已经有来自上传 API 的 HTTPS URL
     pdf_url = "https://oomol-file-cache.example.com/your-file.pdf"
 
@@ -101,14 +111,14 @@ def example_5_remote_pdf():
     print(f"✅ 下载链接: {download_url}")
 
 
-def example_6_custom_polling():
+def example_6_custom_polling(client):
     """示例 6: 自定义轮询策略"""
+    from pdf_craft_sdk import PollingStrategy
+
     print("\n" + "="*60)
     print("示例 6: 自定义轮询策略")
     print("="*60)
 
-    client = PDFCraftClient(api_key=API_KEY)
-
     # 每 3 秒稳定轮询
     download_url = client.convert_local_pdf(
         "document.pdf",
@@ -128,14 +138,14 @@ def example_6_custom_polling():
     print(f"✅ 下载链接: {download_url}")
 
 
-def example_7_error_handling():
+def example_7_error_handling(client):
     """示例 7: 正确的错误处理"""
+    from pdf_craft_sdk import APIError, TimeoutError
+
     print("\n" + "="*60)
     print("示例 7: 错误处理")
     print("="*60)
 
-    client = PDFCraftClient(api_key=API_KEY)
-
     try:
         download_url = client.convert_local_pdf("document.pdf")
         print(f"✅ 成功: {download_url}")
@@ -149,60 +159,70 @@ def example_7_error_handling():
         print(f"❌ 意外错误: {e}")
 
 
-def example_8_batch_processing():
+def example_8_batch_processing(client):
     """示例 8: 批量处理多个文件"""
     print("\n" + "="*60)
     print("示例 8: 批量处理")
     print("="*60)
 
-    client = PDFCraftClient(api_key=API_KEY)
-
     pdf_files = ["doc1.pdf", "doc2.pdf", "doc3.pdf"]
 
-    # 提交所有任务而不等待
+    # 并行上传并提交，且不超过服务端的并发上限
+    max_workers = max(1, min(len(pdf_files), client.get_concurrent_status().max_concurrent_jobs))
     task_ids = []
-    for pdf_file in pdf_files:
-        try:
-            print(f"📄 正在处理 {pdf_file}...")
-            task_id = client.convert_local_pdf(pdf_file, wait=False)
-            task_ids.append((pdf_file, task_id))
-            print(f"✅ 任务已提交: {task_id}")
-        except Exception as e:
-            print(f"❌ 处理 {pdf_file} 时出错: {e}")
-
-    # 等待所有任务完成
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(client.convert_local_pdf, pdf_file, wait=False): pdf_file
+            for pdf_file in pdf_files
+        }
+        for future in as_completed(futures):
+            pdf_file = futures[future]
+            try:
+                task_id = future.result()
+                task_ids.append((pdf_file, task_id))
+                print(f"✅ {pdf_file} 已提交: {task_id}")
+            except Exception as e:
+                print(f"❌ 处理 {pdf_file} 时出错: {e}")
+
+    # 并行等待所有任务，并按完成顺序输出结果，
+    # 先完成的任务无需等待排在前面的慢任务
     print("\n⏳ 正在等待所有任务完成...")
-    for pdf_file, task_id in task_ids:
-        try:
-            download_url = client.wait_for_completion(task_id)
-            print(f"✅ {pdf_file}: {download_url}")
-        except Exception as e:
-            print(f"❌ {pdf_file} 失败: {e}")
+    with ThreadPoolExecutor(max_workers=max(1, len(task_ids))) as executor:
+        futures = {
+            executor.submit(client.wait_for_completion, task_id): pdf_file
+            for pdf_file, task_id in task_ids
+        }
+        for future in as_completed(futures):
+            pdf_file = futures[future]
+            try:
+                print(f"✅ {pdf_file}: {future.result()}")
+            except Exception as e:
+                print(f"❌ {pdf_file} 失败: {e}")
 
 
-def example_9_custom_endpoint():
+def example_9_custom_endpoint(client):
     """示例 9: 使用自定义上传端点"""
+    from pdf_craft_sdk import PDFCraftClient
+
     print("\n" + "="*60)
     print("示例 9: 自定义上传端点")
     print("="*60)
 
-    client = PDFCraftClient(
-        api_key=API_KEY,
+    # 自定义端点需要单独的客户端
+    with PDFCraftClient(
+        api_key=client.api_key,
         upload_base_url="https://custom.example.com/upload"
-    )
-
-    download_url = client.convert_local_pdf("document.pdf")
+    ) as custom_client:
+        download_url = custom_client.convert_local_pdf("document.pdf")
     print(f"✅ 下载链接: {download_url}")
 
 
-def example_10_async_workflow():
+def example_10_async_workflow(client):
     """示例 10: 异步工作流 (现在提交,稍后检查)"""
     print("\n" + "="*60)
     print("示例 10: 异步工作流")
     print("="*60)
 
-    client = PDFCraftClient(api_key=API_KEY)
-
     # 立即提交并获取任务 ID
     task_id = client.convert_local_pdf("document.pdf", wait=False)
     print(f"✅ 任务已提交: {task_id}")
@@ -214,6 +234,86 @@ def example_10_async_workflow():
     print(f"✅ 下载链接: {download_url}")
 
 
+def example_11_batch_api(client):
+    """示例 11: 将多个文件作为一个服务端批次转换"""
+    from pdf_craft_sdk import BatchDetail, JobStatus
+
+    print("\n" + "="*60)
+    print("示例 11: 批处理 API")
+    print("="*60)
+
+    pdf_files = ["doc1.pdf", "doc2.pdf", "doc3.pdf"]
+
+    # 上传所有文件，然后创建并启动一个批次
+    batch = client.convert_files(pdf_files)
+    print(f"✅ 批次已启动: {batch.batch_id} ({batch.total_files} 个文件)")
+
+    # 等待批次进入终止状态。
+    # 有文件完成时 SDK 保持密集轮询，否则逐步退避
+    def on_batch_progress(batch_detail: BatchDetail):
+        print(f"📊 {batch_detail.status}: {batch_detail.completed_files}/{batch_detail.total_files} 个文件 "
+              f"({batch_detail.progress}%)")
+
+    print("\n⏳ 正在等待批次完成...")
+    client.wait_for_batch(batch.batch_id, progress_callback=on_batch_progress)
+
+    # 获取转换结果
+    for job in client.iter_batch_jobs(batch.batch_id):
+        if job.status == JobStatus.COMPLETED.value:
+            print(f"✅ {job.file_name}: {job.result_url}")
+        else:
+            print(f"❌ {job.file_name}: {job.error_message or job.status}")
+
+
+async def example_12_asyncio_concurrency(client):
+    """示例 12: 使用 asyncio 并发处理多个文件"""
+    from pdf_craft_sdk import AsyncPDFCraftClient
+
+    print("\n" + "="*60)
+    print("示例 12: asyncio 并发处理")
+    print("="*60)
+
+    # 异步客户端与同步客户端共享连接池
+    async_client = AsyncPDFCraftClient.from_client(client)
+
+    pdf_files = ["doc1.pdf", "doc2.pdf", "doc3.pdf"]
+
+    # 并发上传并提交所有文件
+    print(f"📄 正在提交 {len(pdf_files)} 个文件...")
+    submissions = await asyncio.gather(
+        *(async_client.convert_local_pdf(pdf_file, wait=False) for pdf_file in pdf_files),
+        return_exceptions=True
+    )
+
+    task_ids = []
+    for pdf_file, result in zip(pdf_files, submissions):
+        if isinstance(result, Exception):
+            print(f"❌ 处理 {pdf_file} 时出错: {result}")
+        else:
+            task_ids.append((pdf_file, result))
+            print(f"✅ {pdf_file} 已提交: {result}")
+
+    # 并发等待所有任务完成
+    print("\n⏳ 正在等待所有任务完成...")
+    results = await asyncio.gather(
+        *(async_client.wait_for_completion(task_id) for _, task_id in task_ids),
+        return_exceptions=True
+    )
+
+    for (pdf_file, _), result in zip(task_ids, results):
+        if isinstance(result, Exception):
+            print(f"❌ {pdf_file} 失败: {result}")
+        else:
+            print(f"✅ {pdf_file}: {result}")
+
+
+def run_example(func, client):
+    """运行示例，协程示例通过 asyncio 驱动"""
+    result = func(client)
+    if asyncio.iscoroutine(result):
+        asyncio.run(result)
+
+
 def main():
     """运行所有示例"""
     print("\n" + "="*60)
@@ -238,6 +338,8 @@ def main():
         ("批量处理", example_8_batch_processing),
         ("自定义端点", example_9_custom_endpoint),
         ("异步工作流", example_10_async_workflow),
+        ("批处理 API", example_11_batch_api),
+        ("asyncio 并发", example_12_asyncio_concurrency),
     ]
 
     print("\n可用示例:")
@@ -245,21 +347,28 @@ def main():
         print(f"  {i}. {name}")
 
     print("\n" + "="*60)
-    choice = input("\n输入示例编号 (1-10) 或 'all' 运行全部: ").strip().lower()
+    choice = input("\n输入示例编号 (1-12) 或 'all' 运行全部: ").strip().lower()
 
     if choice == 'all':
-        for name, func in examples:
-            try:
-                func()
-            except Exception as e:
-                print(f"\n❌ 示例失败: {e}")
+        selected = examples
     elif choice.isdigit() and 1 <= int(choice) <= len(examples):
-        try:
-            examples[int(choice) - 1][1]()
-        except Exception as e:
-            print(f"\n❌ 示例失败: {e}")
+        selected = [examples[int(choice) - 1]]
     else:
         print("❌ 无效选择")
+        selected = []
+
+    if selected:
+        # 选定示例后才导入 SDK
+        from pdf_craft_sdk import PDFCraftClient
+
+        # 所有示例共用一个客户端，连接池可以在示例之间复用；
+        # with 代码块结束时关闭客户端
+        with PDFCraftClient(api_key=API_KEY) as client:
+            for name, func in selected:
+                try:
+                    run_example(func, client)
+                except Exception as e:
+                    print(f"\n❌ 示例失败: {e}")
 
     print("\n" + "="*60)
     print("完成!")
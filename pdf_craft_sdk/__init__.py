@@ -1,6 +1,7 @@
 from .client import PDFCraftClient
-from .exceptions import PDFCraftError, APIError, TimeoutError
-from .enums import FormatType, BatchStatus, JobStatus
+from .async_client import AsyncPDFCraftClient
+from .exceptions import PDFCraftError, APIError, TimeoutError, CancelledError
+from .enums import FormatType, PollingStrategy, BatchStatus, JobStatus
 from .batch_types import (
     BatchFile,
     CreateBatchResponse,
@@ -16,15 +17,19 @@ from .upload_types import (
     InitUploadResponse,
     GetUploadUrlResponse,
     UploadProgress,
-    ProgressCallback
+    ProgressCallback,
+    FileProgressCallback
 )
 
 __all__ = [
     "PDFCraftClient",
+    "AsyncPDFCraftClient",
     "PDFCraftError",
     "APIError",
     "TimeoutError",
+    "CancelledError",
     "FormatType",
+    "PollingStrategy",
     "BatchStatus",
     "JobStatus",
     "BatchFile",
@@ -39,6 +44,7 @@ __all__ = [
     "InitUploadResponse",
     "GetUploadUrlResponse",
     "UploadProgress",
-    "ProgressCallback"
+    "ProgressCallback",
+    "FileProgressCallback"
 ]
 
@@ -0,0 +1,437 @@
+import asyncio
+import functools
+from typing import Optional, Dict, Any, Union, List, Callable, Iterable, AsyncIterator
+from .client import PDFCraftClient, _TERMINAL_BATCH_STATES, _THROTTLED_STATUS_CODES, _PollSchedule
+from .exceptions import APIError, TimeoutError
+from .enums import FormatType, PollingStrategy
+from .batch_types import (
+    BatchFile, CreateBatchResponse, BatchDetail, JobDetail,
+    GetBatchesResponse, GetJobsResponse, ConcurrentStatus, OperationResponse
+)
+from .upload_types import ProgressCallback, FileProgressCallback
+
+
+class AsyncPDFCraftClient:
+    """
+    PDFCraftClient 的异步版本
+
+    HTTP 请求复用内部 PDFCraftClient 的会话，在事件循环的默认线程池中执行；
+    轮询间隔使用 asyncio.sleep，因此多个文件可以通过 asyncio.gather 在同一个事件循环中并发处理。
+
+    Example:
+        ```python
+        async with AsyncPDFCraftClient(api_key="YOUR_API_KEY") as client:
+            urls = await asyncio.gather(
+                *(client.convert_local_pdf(f) for f in ["a.pdf", "b.pdf"])
+            )
+        ```
+    """
+
+    def __init__(self, api_key: str, **kwargs):
+        """
+        Args:
+            api_key: API 密钥
+            **kwargs: 其余参数与 PDFCraftClient 相同
+        """
+        self._client = PDFCraftClient(api_key, **kwargs)
+        self._owns_client = True
+
+    @classmethod
+    def from_client(cls, client: PDFCraftClient) -> "AsyncPDFCraftClient":
+        """
+        基于已有的同步客户端创建异步客户端，两者共享连接池和缓存
+
+        关闭返回的异步客户端不会关闭传入的同步客户端。
+
+        Args:
+            client: 同步客户端
+
+        Returns:
+            AsyncPDFCraftClient: 异步客户端
+        """
+        async_client = cls.__new__(cls)
+        async_client._client = client
+        async_client._owns_client = False
+        return async_client
+
+    @property
+    def api_key(self) -> str:
+        return self._client.api_key
+
+    async def aclose(self) -> None:
+        """关闭底层 HTTP 会话；通过 from_client 创建时不做任何操作"""
+        if self._owns_client:
+            self._client.close()
+
+    async def __aenter__(self) -> "AsyncPDFCraftClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def _run_blocking(self, func, *args, **kwargs):
+        """在事件循环的默认线程池中执行阻塞调用"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+    async def submit_conversion(self,
+                                pdf_url: str,
+                                format_type: Union[str, FormatType] = FormatType.MARKDOWN,
+                                model: str = "gundam",
+                                includes_footnotes: bool = False,
+                                ignore_pdf_errors: bool = True,
+                                ignore_ocr_errors: bool = True) -> str:
+        """submit_conversion 的异步版本，参数与 PDFCraftClient.submit_conversion 相同"""
+        return await self._run_blocking(
+            self._client.submit_conversion,
+            pdf_url,
+            format_type,
+            model,
+            includes_footnotes,
+            ignore_pdf_errors,
+            ignore_ocr_errors
+        )
+
+    async def get_conversion_result(self, task_id: str, format_type: Union[str, FormatType] = FormatType.MARKDOWN) -> Dict[str, Any]:
+        """get_conversion_result 的异步版本"""
+        return await self._run_blocking(self._client.get_conversion_result, task_id, format_type)
+
+    async def wait_for_completion(self,
+                                  task_id: str,
+                                  format_type: Union[str, FormatType] = FormatType.MARKDOWN,
+                                  max_wait_ms: int = 7200000,
+                                  check_interval_ms: int = 1000,
+                                  max_check_interval_ms: int = 5000,
+                                  backoff_factor: Union[float, PollingStrategy] = PollingStrategy.EXPONENTIAL,
+                                  jitter: float = 0.2) -> str:
+        """
+        wait_for_completion 的异步版本
+
+        轮询间隔使用 asyncio.sleep，多个任务可以通过 asyncio.gather 在同一个事件循环中并发等待。
+
+        Args:
+            task_id: 任务 ID
+            format_type: 输出格式（'markdown' 或 'epub' 或 FormatType）
+            max_wait_ms: 最大等待时间（毫秒），默认 2 小时
+            check_interval_ms: 初始轮询间隔（毫秒），默认 1000
+            max_check_interval_ms: 最大轮询间隔（毫秒），默认 5000
+            backoff_factor: 轮询间隔增长因子或 PollingStrategy，默认指数增长
+            jitter: 每次轮询间隔的随机抖动比例（默认 0.2，即 ±20%），为 0 时不抖动
+
+        Returns:
+            str: 下载 URL
+
+        Example:
+            ```python
+            urls = await asyncio.gather(
+                *(client.wait_for_completion(task_id) for task_id in task_ids),
+                return_exceptions=True
+            )
+            ```
+        """
+        schedule = _PollSchedule(max_wait_ms, check_interval_ms, max_check_interval_ms,
+                                 self._client._backoff_factor_value(backoff_factor), jitter)
+
+        while schedule.running():
+            try:
+                result = await self.get_conversion_result(task_id, format_type)
+            except APIError as e:
+                if e.status_code not in _THROTTLED_STATUS_CODES:
+                    raise
+                await asyncio.sleep(schedule.throttled(e.retry_after))
+                continue
+
+            download_url = self._client._extract_download_url(result)
+            if download_url is not None:
+                return download_url
+
+            await asyncio.sleep(schedule.next_delay())
+
+        raise TimeoutError("Conversion timeout")
+
+    async def convert(self,
+                      pdf_url: str,
+                      format_type: Union[str, FormatType] = FormatType.MARKDOWN,
+                      model: str = "gundam",
+                      includes_footnotes: bool = False,
+                      ignore_pdf_errors: bool = True,
+                      ignore_ocr_errors: bool = True,
+                      wait: bool = True,
+                      max_wait_ms: int = 7200000,
+                      check_interval_ms: int = 1000,
+                      max_check_interval_ms: int = 5000,
+                      backoff_factor: Union[float, PollingStrategy] = PollingStrategy.EXPONENTIAL,
+                      jitter: float = 0.2) -> str:
+        """convert 的异步版本，参数与 PDFCraftClient.convert 相同"""
+        task_id = await self.submit_conversion(
+            pdf_url,
+            format_type,
+            model,
+            includes_footnotes,
+            ignore_pdf_errors,
+            ignore_ocr_errors
+        )
+
+        if wait:
+            return await self.wait_for_completion(
+                task_id,
+                format_type,
+                max_wait_ms,
+                check_interval_ms,
+                max_check_interval_ms,
+                backoff_factor,
+                jitter
+            )
+        else:
+            return task_id
+
+    async def upload_file(self,
+                          file_path: str,
+                          progress_callback: ProgressCallback = None,
+                          max_retries: int = 3,
+                          max_workers: int = 8) -> str:
+        """
+        upload_file 的异步版本
+
+        注意：progress_callback 会在工作线程中被调用。
+        """
+        return await self._run_blocking(self._client.upload_file, file_path, progress_callback, max_retries, max_workers)
+
+    async def upload_files(self,
+                           file_paths: List[str],
+                           progress_callback: FileProgressCallback = None,
+                           max_retries: int = 3,
+                           max_workers: int = 8) -> List[str]:
+        """
+        upload_files 的异步版本
+
+        注意：progress_callback 会在工作线程中被调用。
+        """
+        return await self._run_blocking(self._client.upload_files, file_paths, progress_callback, max_retries, max_workers)
+
+    async def convert_local_pdf(self,
+                                file_path: str,
+                                format_type: Union[str, FormatType] = FormatType.MARKDOWN,
+                                model: str = "gundam",
+                                includes_footnotes: bool = False,
+                                ignore_pdf_errors: bool = True,
+                                ignore_ocr_errors: bool = True,
+                                wait: bool = True,
+                                max_wait_ms: int = 7200000,
+                                check_interval_ms: int = 1000,
+                                max_check_interval_ms: int = 5000,
+                                backoff_factor: Union[float, PollingStrategy] = PollingStrategy.EXPONENTIAL,
+                                progress_callback: ProgressCallback = None,
+                                upload_max_retries: int = 3,
+                                jitter: float = 0.2) -> str:
+        """
+        convert_local_pdf 的异步版本
+
+        上传和提交在线程池中执行，等待阶段使用 wait_for_completion，
+        因此多个文件可以通过 asyncio.gather 并发处理。
+        注意：progress_callback 会在工作线程中被调用。
+
+        Args:
+            参数与 PDFCraftClient.convert_local_pdf 相同
+
+        Returns:
+            如果 wait 为 True，返回下载 URL (str)
+            如果 wait 为 False，返回任务 ID (str)
+
+        Example:
+            ```python
+            task_ids = await asyncio.gather(
+                *(client.convert_local_pdf(f, wait=False) for f in ["a.pdf", "b.pdf"])
+            )
+            ```
+        """
+        cache_url = await self.upload_file(file_path, progress_callback, upload_max_retries)
+
+        return await self.convert(
+            cache_url,
+            format_type,
+            model,
+            includes_footnotes,
+            ignore_pdf_errors,
+            ignore_ocr_errors,
+            wait,
+            max_wait_ms,
+            check_interval_ms,
+            max_check_interval_ms,
+            backoff_factor,
+            jitter
+        )
+
+    async def convert_files(self,
+                            file_paths: List[str],
+                            output_format: Union[str, FormatType] = FormatType.MARKDOWN,
+                            includes_footnotes: bool = False,
+                            upload_max_retries: int = 3,
+                            max_workers: int = 8) -> CreateBatchResponse:
+        """convert_files 的异步版本，参数与 PDFCraftClient.convert_files 相同"""
+        return await self._run_blocking(
+            self._client.convert_files,
+            file_paths,
+            output_format,
+            includes_footnotes,
+            upload_max_retries,
+            max_workers
+        )
+
+    # ==================== 批处理 API 方法 ====================
+
+    async def create_batch(
+        self,
+        files: List[Union[BatchFile, Dict[str, Any]]],
+        output_format: Union[str, FormatType] = FormatType.MARKDOWN,
+        includes_footnotes: bool = False
+    ) -> CreateBatchResponse:
+        """create_batch 的异步版本"""
+        return await self._run_blocking(self._client.create_batch, files, output_format, includes_footnotes)
+
+    async def start_batch(self, batch_id: str) -> OperationResponse:
+        """start_batch 的异步版本"""
+        return await self._run_blocking(self._client.start_batch, batch_id)
+
+    async def get_batch(self, batch_id: str, use_cache: bool = True) -> BatchDetail:
+        """get_batch 的异步版本"""
+        return await self._run_blocking(self._client.get_batch, batch_id, use_cache)
+
+    async def wait_for_batch(
+        self,
+        batch_id: str,
+        max_wait_ms: int = 7200000,
+        check_interval_ms: int = 2000,
+        max_check_interval_ms: int = 60000,
+        backoff_factor: Union[float, PollingStrategy] = PollingStrategy.EXPONENTIAL,
+        progress_callback: Optional[Callable[[BatchDetail], None]] = None,
+        jitter: float = 0.2
+    ) -> BatchDetail:
+        """
+        wait_for_batch 的异步版本
+
+        轮询策略与 PDFCraftClient.wait_for_batch 相同，间隔使用 asyncio.sleep，
+        多个批次可以通过 asyncio.gather 并发等待。progress_callback 在事件循环线程中调用。
+
+        Args:
+            参数与 PDFCraftClient.wait_for_batch 相同
+
+        Returns:
+            BatchDetail: 处于终止状态的批次详情
+
+        Raises:
+            TimeoutError: 超过最大等待时间
+
+        Example:
+            ```python
+            batches = await asyncio.gather(
+                *(client.wait_for_batch(batch_id) for batch_id in batch_ids)
+            )
+            ```
+        """
+        schedule = _PollSchedule(max_wait_ms, check_interval_ms, max_check_interval_ms,
+                                 self._client._backoff_factor_value(backoff_factor), jitter)
+        last_completed = None
+        last_reported = None
+
+        while schedule.running():
+            try:
+                batch_detail = await self.get_batch(batch_id, use_cache=False)
+            except APIError as e:
+                if e.status_code not in _THROTTLED_STATUS_CODES:
+                    raise
+                await asyncio.sleep(schedule.throttled(e.retry_after))
+                continue
+
+            reported = (batch_detail.status, batch_detail.progress,
+                        batch_detail.completed_files, batch_detail.failed_files)
+            if progress_callback and reported != last_reported:
+                progress_callback(batch_detail)
+            last_reported = reported
+
+            if batch_detail.status in _TERMINAL_BATCH_STATES:
+                return batch_detail
+
+            if batch_detail.completed_files != last_completed:
+                last_completed = batch_detail.completed_files
+                schedule.reset()
+
+            await asyncio.sleep(schedule.next_delay())
+
+        raise TimeoutError("Batch timeout")
+
+    async def get_batches(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        status: Optional[str] = "all",
+        sort_by: str = "createdAt",
+        sort_order: str = "desc",
+        fields: Optional[Union[str, Iterable[str]]] = None
+    ) -> GetBatchesResponse:
+        """get_batches 的异步版本"""
+        return await self._run_blocking(
+            self._client.get_batches, page, page_size, status, sort_by, sort_order, fields
+        )
+
+    async def get_batch_jobs(
+        self,
+        batch_id: str,
+        page: int = 1,
+        page_size: int = 20,
+        status: Optional[str] = "all"
+    ) -> GetJobsResponse:
+        """get_batch_jobs 的异步版本"""
+        return await self._run_blocking(self._client.get_batch_jobs, batch_id, page, page_size, status)
+
+    async def iter_batch_jobs(
+        self,
+        batch_id: str,
+        status: Optional[str] = "all",
+        page_size: int = 100
+    ) -> AsyncIterator[JobDetail]:
+        """
+        iter_batch_jobs 的异步版本，自动翻页
+
+        Example:
+            ```python
+            async for job in client.iter_batch_jobs("019aa097-f28d-7000-8d56-6a2987a7b144"):
+                print(job.file_name, job.result_url)
+            ```
+        """
+        page = 1
+        while True:
+            result = await self.get_batch_jobs(batch_id, page=page, page_size=page_size, status=status)
+            for job in result.jobs:
+                yield job
+            if page >= result.pagination.total_pages:
+                return
+            page += 1
+
+    async def cancel_batch(self, batch_id: str) -> OperationResponse:
+        """cancel_batch 的异步版本"""
+        return await self._run_blocking(self._client.cancel_batch, batch_id)
+
+    async def pause_batch(self, batch_id: str) -> OperationResponse:
+        """pause_batch 的异步版本"""
+        return await self._run_blocking(self._client.pause_batch, batch_id)
+
+    async def resume_batch(self, batch_id: str) -> OperationResponse:
+        """resume_batch 的异步版本"""
+        return await self._run_blocking(self._client.resume_batch, batch_id)
+
+    async def retry_job(self, job_id: str) -> OperationResponse:
+        """retry_job 的异步版本"""
+        return await self._run_blocking(self._client.retry_job, job_id)
+
+    async def retry_failed_jobs(self, batch_id: str) -> OperationResponse:
+        """retry_failed_jobs 的异步版本"""
+        return await self._run_blocking(self._client.retry_failed_jobs, batch_id)
+
+    async def cancel_job(self, job_id: str) -> OperationResponse:
+        """cancel_job 的异步版本"""
+        return await self._run_blocking(self._client.cancel_job, job_id)
+
+    async def get_concurrent_status(self) -> ConcurrentStatus:
+        """get_concurrent_status 的异步版本"""
+        return await self._run_blocking(self._client.get_concurrent_status)
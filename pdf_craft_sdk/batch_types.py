@@ -1,10 +1,14 @@
 """批处理相关的数据类型定义"""
+import sys
 from typing import Optional, List
 from dataclasses import dataclass
 from .enums import BatchStatus, JobStatus, FormatType
 
+# Python 3.10+ 支持 slots=True：实例不再携带 __dict__，大量任务详情占用的内存明显减少
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class BatchFile:
     """批次文件信息"""
     url: str
@@ -17,7 +21,7 @@ class BatchFile:
     """文件大小（字节）"""
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CreateBatchResponse:
     """创建批次响应"""
     batch_id: str
@@ -36,7 +40,7 @@ class CreateBatchResponse:
     """创建时间"""
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BatchDetail:
     """批次详情"""
     id: str
@@ -73,7 +77,7 @@ class BatchDetail:
     """更新时间"""
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class JobDetail:
     """任务详情"""
     id: str
@@ -127,8 +131,21 @@ class JobDetail:
     updated_at: str
     """更新时间"""
 
+    @classmethod
+    def from_api(cls, data: dict) -> "JobDetail":
+        """由 API 返回的任务字典（camelCase 字段）创建，缺失的字段为 None"""
+        return cls(*map(data.get, _JOB_API_KEYS))
+
+
+# JobDetail 各字段对应的 API 字段名，顺序与字段定义一致
+_JOB_API_KEYS = (
+    "id", "batchId", "userId", "outputFormat", "sourceUrl", "fileName", "fileSize",
+    "status", "resultUrl", "errorMessage", "progress", "retryCount", "taskId",
+    "startedAt", "completedAt", "createdAt", "updatedAt"
+)
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Pagination:
     """分页信息"""
     page: int
@@ -144,7 +161,7 @@ class Pagination:
     """总页数"""
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class GetBatchesResponse:
     """获取批次列表响应"""
     batches: List[dict]
@@ -154,7 +171,7 @@ class GetBatchesResponse:
     """分页信息"""
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class GetJobsResponse:
     """获取任务列表响应"""
     jobs: List[JobDetail]
@@ -164,7 +181,7 @@ class GetJobsResponse:
     """分页信息"""
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ConcurrentStatus:
     """用户并发状态"""
     max_concurrent_jobs: int
@@ -183,7 +200,7 @@ class ConcurrentStatus:
     """排队中的任务数"""
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class OperationResponse:
     """操作响应"""
     batch_id: Optional[str] = None
@@ -1,17 +1,223 @@
 import time
 import os
+import mmap
+import random
+import threading
+from collections import OrderedDict
 import requests
-from typing import Optional, Dict, Any, Union, List, BinaryIO
-from .exceptions import APIError, TimeoutError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from contextlib import ExitStack, contextmanager
+from typing import Optional, Dict, Any, Union, List, BinaryIO, Tuple, Callable, Iterator, Iterable
+from .exceptions import APIError, TimeoutError, CancelledError
 from .enums import FormatType, PollingStrategy, BatchStatus, JobStatus
 from .batch_types import (
     BatchFile, CreateBatchResponse, BatchDetail, JobDetail,
     GetBatchesResponse, GetJobsResponse, ConcurrentStatus, OperationResponse, Pagination
 )
-from .upload_types import InitUploadResponse, GetUploadUrlResponse, UploadProgress, ProgressCallback
+from .upload_types import InitUploadResponse, GetUploadUrlResponse, UploadProgress, ProgressCallback, FileProgressCallback
+
+try:
+    # orjson 解析和序列化都明显快于标准库，并且直接处理 bytes；未安装时回退到 json
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+_FORMAT_VALUES = frozenset(t.value for t in FormatType)
+# 列表查询的筛选和排序参数，在本地校验以免拼写错误白白多一次请求
+_BATCH_STATUS_FILTERS = frozenset(s.value for s in BatchStatus) | {"all"}
+_JOB_STATUS_FILTERS = frozenset(s.value for s in JobStatus) | {"all"}
+_SORT_ORDERS = frozenset(["asc", "desc"])
+# 限流或服务暂时不可用，轮询时应退避后继续，而不是直接失败
+_THROTTLED_STATUS_CODES = frozenset([429, 503])
+
+# 终止状态不会再变化（除非显式重试），查询到后即可缓存
+_TERMINAL_TASK_STATES = frozenset(["completed", "failed"])
+_TERMINAL_BATCH_STATES = frozenset([
+    BatchStatus.COMPLETED.value, BatchStatus.FAILED.value, BatchStatus.CANCELLED.value
+])
+# 每个客户端最多缓存的终止状态任务结果和批次详情数量
+_TERMINAL_CACHE_SIZE = 1024
+# 每个客户端短期查询缓存的最大条目数
+_QUERY_CACHE_SIZE = 256
+
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """解析以秒为单位的 Retry-After 响应头；缺失或为 HTTP 日期格式时返回 None"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _sleep(seconds: float, stop_event: Optional[threading.Event]) -> None:
+    """等待指定秒数；stop_event 在等待期间被设置时立即抛出 CancelledError"""
+    if stop_event is None:
+        time.sleep(seconds)
+    elif stop_event.wait(seconds):
+        raise CancelledError("Wait cancelled")
+
+
+def _jittered(interval_sec: float, jitter: float) -> float:
+    """在轮询间隔上加入 ±jitter 比例的随机抖动，避免同时启动的多个客户端始终同步轮询；jitter 为 0 时不抖动"""
+    if jitter <= 0:
+        return interval_sec
+    return interval_sec * random.uniform(1 - jitter, 1 + jitter)
+
+
+class _PollSchedule:
+    """
+    wait_for_completion 和 wait_for_batch 的轮询节奏，同步和异步客户端共用
+
+    只计算每次应等待的秒数，实际等待由调用方完成（Event.wait 或 asyncio.sleep）。
+    """
+
+    def __init__(self, max_wait_ms: int, check_interval_ms: int, max_check_interval_ms: int, factor: float, jitter: float):
+        self._start_time = time.time()
+        self._timeout_sec = max_wait_ms / 1000.0
+        self._initial_interval_sec = check_interval_ms / 1000.0
+        self._interval_sec = self._initial_interval_sec
+        self._max_interval_sec = max_check_interval_ms / 1000.0
+        self._factor = factor
+        self._jitter = jitter
+
+    def running(self) -> bool:
+        """是否仍在最大等待时间之内"""
+        return time.time() - self._start_time < self._timeout_sec
+
+    def _until_deadline(self, delay: float) -> float:
+        """等待时间不超过剩余的最大等待时间，避免过长的 Retry-After 让等待超出 max_wait_ms"""
+        remaining = self._timeout_sec - (time.time() - self._start_time)
+        return max(0.0, min(delay, remaining))
+
+    def _grow(self) -> None:
+        self._interval_sec = min(self._interval_sec * self._factor, self._max_interval_sec)
+
+    def reset(self) -> None:
+        """有进展时恢复到初始间隔，重新开始密集轮询"""
+        self._interval_sec = self._initial_interval_sec
+
+    def next_delay(self) -> float:
+        """本次轮询后应等待的秒数（带抖动），之后间隔按 factor 增长"""
+        delay = _jittered(self._interval_sec, self._jitter)
+        self._grow()
+        return self._until_deadline(delay)
+
+    def throttled(self, retry_after: Optional[float]) -> float:
+        """被限流或服务暂时不可用时应等待的秒数：间隔先增长，服务端给出 Retry-After 时以其为准"""
+        self._grow()
+        return self._until_deadline(max(self._interval_sec, retry_after or 0))
+
+
+def _batch_file_to_dict(file: Union[BatchFile, Dict[str, Any]]) -> Dict[str, Any]:
+    """把 BatchFile 转换为 API 需要的字典；字典原样返回"""
+    if type(file) is dict:
+        return file
+    if isinstance(file, BatchFile):
+        if file.file_size is None:
+            return {"url": file.url, "fileName": file.file_name}
+        return {"url": file.url, "fileName": file.file_name, "fileSize": file.file_size}
+    if isinstance(file, dict):
+        return file
+    raise ValueError("Each file must be a BatchFile object or a dictionary")
+
+
+@contextmanager
+def _map_file(file_path: str) -> Iterator[Union[mmap.mmap, bytes]]:
+    """以只读方式映射整个文件，分片直接从映射中切片；空文件无法映射，返回 b''"""
+    try:
+        f = open(file_path, 'rb')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}")
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as file_map:
+            yield file_map
+
+
+class _TTLCache:
+    """按 key 缓存查询结果，超过 ttl 后失效；ttl 为 0 时不缓存。最多保留 max_size 个条目，可在多个线程中共用"""
+
+    def __init__(self, ttl_sec: float, max_size: int):
+        self.ttl_sec = ttl_sec
+        self.max_size = max_size
+        # 所有条目的 ttl 相同，按写入顺序排列即按过期时间排列
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                self._entries.pop(key, None)
+                return None
+            return value
+
+    def set(self, key: Tuple, value: Any) -> None:
+        if self.ttl_sec <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (now + self.ttl_sec, value)
+            self._entries.move_to_end(key)
+            # 清理已过期的条目，不必等到同一个 key 再次被读取；仍超出上限时淘汰最早写入的条目
+            while self._entries:
+                oldest_key, (expires_at, _) = next(iter(self._entries.items()))
+                if expires_at > now and len(self._entries) <= self.max_size:
+                    break
+                del self._entries[oldest_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class _LRUCache:
+    """最多保留 max_size 个条目，超出时淘汰最久未使用的条目；可在多个线程中共用"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
 
 class PDFCraftClient:
-    def __init__(self, api_key: str, base_url: str = "https://fusion-api.oomol.com/v1", batch_base_url: Optional[str] = None, upload_base_url: Optional[str] = None):
+    def __init__(self, api_key: str, base_url: str = "https://fusion-api.oomol.com/v1", batch_base_url: Optional[str] = None, upload_base_url: Optional[str] = None, cache_ttl_ms: int = 0, pool_size: int = 32, request_timeout: Union[float, Tuple[float, float]] = 30.0):
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
         # 批处理 API 基础 URL，默认使用 https://pdf-server.oomol.com/api/v1/conversion
@@ -22,11 +228,95 @@ class PDFCraftClient:
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}"
         }
+        # 各输出格式的提交和查询地址在客户端生命周期内不变，预先拼好
+        self._submit_endpoints = {t.value: f"{self.base_url}/pdf-transform-{t.value}/submit" for t in FormatType}
+        self._result_endpoints = {t.value: f"{self.base_url}/pdf-transform-{t.value}/result/" for t in FormatType}
+        # 所有请求共用一个会话，复用 keep-alive 连接，避免每次请求都重新进行 TCP/TLS 握手。
+        # 连接池按主机划分（API、批处理、上传和分片存储各一个），每个主机最多保留 pool_size 个连接；
+        # 并发数超过 pool_size 时不会阻塞，多出的连接用完即关闭
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        # 连接失败以及 GET 遇到网关错误时由 urllib3 自动退避重试；POST 可能已被服务端处理，
+        # 不做读取或状态码重试，以免重复提交。重试耗尽后返回原响应，由调用方抛出 APIError。
+        # 429/503 不在此重试，也不在 urllib3 内部按 Retry-After 等待，直接交给轮询循环处理，
+        # 这样 stop_event 和轮询间隔始终有效
+        retry = Retry(
+            total=3,
+            connect=3,
+            read=2,
+            backoff_factor=0.5,
+            status_forcelist=[502, 504],
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, pool_block=False, max_retries=retry)
+        # 单次请求的超时（秒），也可以是 (连接超时, 读取超时)；避免服务端无响应时轮询永远阻塞
+        self._timeout = request_timeout
+        # 分片上传的请求体可能很大，发送耗时取决于上行带宽，只限制连接时间，不限制读写时间
+        connect_timeout = request_timeout[0] if isinstance(request_timeout, tuple) else request_timeout
+        self._upload_timeout = (connect_timeout, None)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # 已进入终止状态的任务结果和批次详情，避免重复轮询；
+        # 长期复用的客户端会处理大量任务，只保留最近使用的条目
+        self._terminal_results = _LRUCache(_TERMINAL_CACHE_SIZE)
+        self._terminal_batches = _LRUCache(_TERMINAL_CACHE_SIZE)
+        # get_concurrent_status / get_batch / get_batches / get_batch_jobs 的短期缓存，默认关闭
+        self._query_cache = _TTLCache(cache_ttl_ms / 1000.0, _QUERY_CACHE_SIZE)
+
+    def close(self) -> None:
+        """关闭底层 HTTP 会话，释放连接池中的连接"""
+        self._session.close()
+
+    def __enter__(self) -> "PDFCraftClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    async def aclose(self) -> None:
+        """close 的异步版本，便于在 async with 中使用"""
+        self.close()
+
+    async def __aenter__(self) -> "PDFCraftClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """
+        发送请求并解析 JSON 响应
+
+        Raises:
+            APIError: 响应不是合法的 JSON，或 HTTP 状态码表示失败
+        """
+        if "json" in kwargs:
+            # Content-Type 已在会话的默认请求头中设置
+            kwargs["data"] = _json_dumps(kwargs.pop("json"))
+        response = self._session.request(method, endpoint, timeout=self._timeout, **kwargs)
+        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+
+        try:
+            result = _json_loads(response.content)
+        except ValueError:
+            raise APIError(f"Invalid JSON response: {response.text}", response.status_code, retry_after)
+
+        if not response.ok:
+            raise APIError(f"HTTP {response.status_code}: {response.text}", response.status_code, retry_after)
+
+        return result
+
+    def _request_data(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """与 _request 相同，但返回包装在 data 字段中的响应内容"""
+        result = self._request(method, endpoint, **kwargs)
+        return result.get("data", result)
 
     def _ensure_format_type(self, format_type: Union[str, FormatType]) -> str:
         if isinstance(format_type, FormatType):
             return format_type.value
-        if format_type not in [t.value for t in FormatType]:
+        if format_type not in _FORMAT_VALUES:
             raise ValueError(f"format_type must be one of {[t.value for t in FormatType]}")
         return format_type
 
@@ -53,7 +343,7 @@ class PDFCraftClient:
         """
         format_type_str = self._ensure_format_type(format_type)
 
-        endpoint = f"{self.base_url}/pdf-transform-{format_type_str}/submit"
+        endpoint = self._submit_endpoints[format_type_str]
         data = {
             "pdfURL": pdf_url,
             "model": model,
@@ -62,15 +352,7 @@ class PDFCraftClient:
             "ignoreOCRErrors": ignore_ocr_errors
         }
 
-        response = requests.post(endpoint, json=data, headers=self.headers)
-        
-        try:
-            result = response.json()
-        except ValueError:
-            raise APIError(f"Invalid JSON response: {response.text}")
-
-        if not response.ok:
-             raise APIError(f"HTTP {response.status_code}: {response.text}")
+        result = self._request("POST", endpoint, json=data)
 
         if result.get("success"):
             return result["sessionID"]
@@ -89,26 +371,50 @@ class PDFCraftClient:
             dict: The result dictionary
         """
         format_type_str = self._ensure_format_type(format_type)
-        endpoint = f"{self.base_url}/pdf-transform-{format_type_str}/result/{task_id}"
-        response = requests.get(endpoint, headers=self.headers)
-
-        try:
-            result = response.json()
-        except ValueError:
-             raise APIError(f"Invalid JSON response: {response.text}")
+        cached = self._terminal_results.get(task_id)
+        if cached is not None:
+            return cached
 
-        if not response.ok:
-            raise APIError(f"HTTP {response.status_code}: {response.text}")
+        endpoint = self._result_endpoints[format_type_str] + task_id
+        result = self._request("GET", endpoint)
 
+        if result.get("state") in _TERMINAL_TASK_STATES:
+            self._terminal_results.set(task_id, result)
         return result
 
+    def _backoff_factor_value(self, backoff_factor: Union[float, PollingStrategy]) -> float:
+        if isinstance(backoff_factor, PollingStrategy):
+            return backoff_factor.value
+        return float(backoff_factor)
+
+    def _extract_download_url(self, result: Dict[str, Any]) -> Optional[str]:
+        """
+        Interpret a conversion result
+
+        Returns:
+            The download URL if the task completed, None if it is still running
+        """
+        state = result.get("state")
+        if state == "completed":
+            # Check if data exists and has downloadURL
+            data = result.get("data")
+            if data and "downloadURL" in data:
+                return data["downloadURL"]
+            else:
+                 raise APIError(f"Task completed but downloadURL missing in response: {result}")
+        elif state == "failed":
+            raise APIError(f"Conversion failed: {result.get('error', 'Unknown error')}")
+        return None
+
     def wait_for_completion(self, 
                             task_id: str, 
                             format_type: Union[str, FormatType] = FormatType.MARKDOWN, 
                             max_wait_ms: int = 7200000, 
                             check_interval_ms: int = 1000,
                             max_check_interval_ms: int = 5000,
-                            backoff_factor: Union[float, PollingStrategy] = PollingStrategy.EXPONENTIAL) -> str:
+                            backoff_factor: Union[float, PollingStrategy] = PollingStrategy.EXPONENTIAL,
+                            stop_event: Optional[threading.Event] = None,
+                            jitter: float = 0.2) -> str:
         """
         Poll until conversion completes
         
@@ -119,40 +425,33 @@ class PDFCraftClient:
             check_interval_ms: Initial interval in milliseconds (default 1000)
             max_check_interval_ms: Maximum interval in milliseconds (default 5000)
             backoff_factor: Multiplier for increasing interval or PollingStrategy enum (default 1.5)
+            stop_event: Optional threading.Event; setting it from another thread aborts the wait
+            jitter: Randomize each interval by up to this fraction (default 0.2, i.e. ±20%); 0 disables it
             
         Returns:
             download_url (str): The URL to download the result
+
+        Raises:
+            CancelledError: stop_event was set while waiting
         """
-        start_time = time.time()
-        timeout_sec = max_wait_ms / 1000.0
-        
-        # Determine backoff factor value
-        if isinstance(backoff_factor, PollingStrategy):
-            factor = backoff_factor.value
-        else:
-            factor = float(backoff_factor)
-
-        current_interval_sec = check_interval_ms / 1000.0
-        max_interval_sec = max_check_interval_ms / 1000.0
-
-        while time.time() - start_time < timeout_sec:
-            result = self.get_conversion_result(task_id, format_type)
-
-            state = result.get("state")
-            if state == "completed":
-                # Check if data exists and has downloadURL
-                data = result.get("data")
-                if data and "downloadURL" in data:
-                    return data["downloadURL"]
-                else:
-                     raise APIError(f"Task completed but downloadURL missing in response: {result}")
-            elif state == "failed":
-                raise APIError(f"Conversion failed: {result.get('error', 'Unknown error')}")
-            
-            time.sleep(current_interval_sec)
-            
-            # Update interval
-            current_interval_sec = min(current_interval_sec * factor, max_interval_sec)
+        schedule = _PollSchedule(max_wait_ms, check_interval_ms, max_check_interval_ms,
+                                 self._backoff_factor_value(backoff_factor), jitter)
+
+        while schedule.running():
+            try:
+                result = self.get_conversion_result(task_id, format_type)
+            except APIError as e:
+                # 被限流或服务暂时不可用时退避后继续轮询
+                if e.status_code not in _THROTTLED_STATUS_CODES:
+                    raise
+                _sleep(schedule.throttled(e.retry_after), stop_event)
+                continue
+
+            download_url = self._extract_download_url(result)
+            if download_url is not None:
+                return download_url
+
+            _sleep(schedule.next_delay(), stop_event)
 
         raise TimeoutError("Conversion timeout")
 
@@ -167,7 +466,9 @@ class PDFCraftClient:
                 max_wait_ms: int = 7200000,
                 check_interval_ms: int = 1000,
                 max_check_interval_ms: int = 5000,
-                backoff_factor: Union[float, PollingStrategy] = PollingStrategy.EXPONENTIAL) -> Union[str, Dict[str, Any]]:
+                backoff_factor: Union[float, PollingStrategy] = PollingStrategy.EXPONENTIAL,
+                stop_event: Optional[threading.Event] = None,
+                jitter: float = 0.2) -> Union[str, Dict[str, Any]]:
         """
         High-level method to convert PDF.
 
@@ -183,18 +484,75 @@ class PDFCraftClient:
             check_interval_ms: Initial interval in milliseconds (default 1000)
             max_check_interval_ms: Maximum interval in milliseconds (default 5000)
             backoff_factor: Multiplier for increasing interval or PollingStrategy enum (default exponential)
+            stop_event: Optional threading.Event; once set, the task is not submitted and waiting stops
+            jitter: Randomize each interval by up to this fraction (default 0.2); 0 disables it
 
         Returns:
             If wait is True, returns download URL (str)
             If wait is False, returns task ID (str)
+
+        Raises:
+            CancelledError: stop_event was set before submitting or while waiting
         """
+        if stop_event is not None and stop_event.is_set():
+            raise CancelledError("Conversion cancelled")
+
         task_id = self.submit_conversion(pdf_url, format_type, model, includes_footnotes, ignore_pdf_errors, ignore_ocr_errors)
 
         if wait:
-            return self.wait_for_completion(task_id, format_type, max_wait_ms, check_interval_ms, max_check_interval_ms, backoff_factor)
+            return self.wait_for_completion(task_id, format_type, max_wait_ms, check_interval_ms, max_check_interval_ms, backoff_factor,
+                                            stop_event, jitter)
         else:
             return task_id
 
+    def convert_many(self,
+                     pdf_urls: List[str],
+                     max_workers: int = 8,
+                     **kwargs) -> List[str]:
+        """
+        Convert several PDFs concurrently.
+
+        Each URL is converted with `convert` in a thread pool, so submissions and polling
+        overlap and reuse the client's pooled connections.
+
+        When a conversion fails, conversions that have not started are cancelled and running
+        ones stop waiting with CancelledError. If you pass your own stop_event in kwargs it is
+        not set for you, so running conversions keep waiting until you set it or they finish.
+
+        Args:
+            pdf_urls: URLs of the PDF files
+            max_workers: Maximum number of conversions running at the same time (default 8)
+            **kwargs: Passed to `convert` for every URL
+
+        Returns:
+            List of download URLs (or task IDs if wait=False), in the same order as pdf_urls
+
+        Raises:
+            The first error to occur in time, once the other running conversions have stopped
+        """
+        if not pdf_urls:
+            return []
+
+        if kwargs.get("stop_event") is None:
+            kwargs["stop_event"] = threading.Event()
+            owns_stop_event = True
+        else:
+            owns_stop_event = False
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pdf_urls))) as executor:
+            futures = {executor.submit(self.convert, pdf_url, **kwargs): index for index, pdf_url in enumerate(pdf_urls)}
+            results: List[Optional[str]] = [None] * len(pdf_urls)
+            try:
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                if owns_stop_event:
+                    kwargs["stop_event"].set()
+                raise
+            return results
+
     # ==================== 批处理 API 方法 ====================
 
     def create_batch(
@@ -229,21 +587,9 @@ class PDFCraftClient:
         format_type_str = self._ensure_format_type(output_format)
 
         # 转换文件列表为字典格式
-        files_data = []
-        for file in files:
-            if isinstance(file, BatchFile):
-                file_dict = {
-                    "url": file.url,
-                    "fileName": file.file_name
-                }
-                if file.file_size is not None:
-                    file_dict["fileSize"] = file.file_size
-                files_data.append(file_dict)
-            elif isinstance(file, dict):
-                files_data.append(file)
-            else:
-                raise ValueError("Each file must be a BatchFile object or a dictionary")
+        files_data = [_batch_file_to_dict(file) for file in files]
 
+        self._query_cache.clear()
         endpoint = f"{self.batch_base_url}/batches"
         data = {
             "files": files_data,
@@ -251,18 +597,7 @@ class PDFCraftClient:
             "includesFootnotes": includes_footnotes
         }
 
-        response = requests.post(endpoint, json=data, headers=self.headers)
-
-        try:
-            result = response.json()
-        except ValueError:
-            raise APIError(f"Invalid JSON response: {response.text}")
-
-        if not response.ok:
-            raise APIError(f"HTTP {response.status_code}: {response.text}")
-
-        # 处理包装在 data 字段中的响应
-        data_result = result.get("data", result)
+        data_result = self._request_data("POST", endpoint, json=data)
 
         return CreateBatchResponse(
             batch_id=data_result["batchId"],
@@ -288,31 +623,23 @@ class PDFCraftClient:
             print("Queued jobs:", result.queued_jobs)
             ```
         """
+        self._terminal_batches.pop(batch_id)
+        self._query_cache.clear()
         endpoint = f"{self.batch_base_url}/batches/{batch_id}/start"
-        response = requests.post(endpoint, headers=self.headers)
-
-        try:
-            result = response.json()
-        except ValueError:
-            raise APIError(f"Invalid JSON response: {response.text}")
-
-        if not response.ok:
-            raise APIError(f"HTTP {response.status_code}: {response.text}")
-
-        # 处理包装在 data 字段中的响应
-        data_result = result.get("data", result)
+        data_result = self._request_data("POST", endpoint)
 
         return OperationResponse(
             batch_id=data_result.get("batchId"),
             queued_jobs=data_result.get("queuedJobs")
         )
 
-    def get_batch(self, batch_id: str) -> BatchDetail:
+    def get_batch(self, batch_id: str, use_cache: bool = True) -> BatchDetail:
         """
         获取批次详情
 
         Args:
             batch_id: 批次 ID
+            use_cache: 是否使用 cache_ttl_ms 短期缓存（默认 True）；需要最新状态时传 False
 
         Returns:
             BatchDetail: 批次详情
@@ -323,21 +650,20 @@ class PDFCraftClient:
             print("Progress:", batch.progress)
             ```
         """
-        endpoint = f"{self.batch_base_url}/batches/{batch_id}"
-        response = requests.get(endpoint, headers=self.headers)
-
-        try:
-            result = response.json()
-        except ValueError:
-            raise APIError(f"Invalid JSON response: {response.text}")
+        cached = self._terminal_batches.get(batch_id)
+        if cached is not None:
+            return cached
 
-        if not response.ok:
-            raise APIError(f"HTTP {response.status_code}: {response.text}")
+        cache_key = ("batch", batch_id)
+        if use_cache:
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-        # 处理包装在 data 字段中的响应
-        data_result = result.get("data", result)
+        endpoint = f"{self.batch_base_url}/batches/{batch_id}"
+        data_result = self._request_data("GET", endpoint)
 
-        return BatchDetail(
+        batch_detail = BatchDetail(
             id=data_result["id"],
             user_id=data_result["userId"],
             status=data_result["status"],
@@ -351,13 +677,99 @@ class PDFCraftClient:
             updated_at=data_result["updatedAt"]
         )
 
+        # 终止状态的批次已由 _terminal_batches 保存，只有进行中的批次放入有上限的短期缓存
+        if batch_detail.status in _TERMINAL_BATCH_STATES:
+            self._terminal_batches.set(batch_id, batch_detail)
+        else:
+            self._query_cache.set(cache_key, batch_detail)
+        return batch_detail
+
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        max_wait_ms: int = 7200000,
+        check_interval_ms: int = 2000,
+        max_check_interval_ms: int = 60000,
+        backoff_factor: Union[float, PollingStrategy] = PollingStrategy.EXPONENTIAL,
+        progress_callback: Optional[Callable[[BatchDetail], None]] = None,
+        stop_event: Optional[threading.Event] = None,
+        jitter: float = 0.2
+    ) -> BatchDetail:
+        """
+        轮询直到批次进入终止状态（completed、failed 或 cancelled）
+
+        服务端没有提供长轮询或推送接口，因此采用自适应轮询：每当有新文件完成时，
+        轮询间隔重置为 check_interval_ms，否则按 backoff_factor 增长，直到 max_check_interval_ms。
+
+        Args:
+            batch_id: 批次 ID
+            max_wait_ms: 最大等待时间（毫秒），默认 2 小时
+            check_interval_ms: 初始轮询间隔（毫秒），默认 2000
+            max_check_interval_ms: 最大轮询间隔（毫秒），默认 60000
+            backoff_factor: 轮询间隔增长因子或 PollingStrategy，默认指数增长
+            progress_callback: 批次状态或进度变化时调用，接收最新的 BatchDetail
+            stop_event: 可选的 threading.Event，在其他线程中设置后立即停止等待
+            jitter: 每次轮询间隔的随机抖动比例（默认 0.2，即 ±20%），为 0 时不抖动
+
+        Returns:
+            BatchDetail: 处于终止状态的批次详情
+
+        Raises:
+            TimeoutError: 超过最大等待时间
+            CancelledError: 等待期间 stop_event 被设置
+
+        Example:
+            ```python
+            batch = client.wait_for_batch(
+                "019aa097-f28d-7000-8d56-6a2987a7b144",
+                progress_callback=lambda b: print(f"Progress: {b.progress}%")
+            )
+            print("Final status:", batch.status)
+            ```
+        """
+        schedule = _PollSchedule(max_wait_ms, check_interval_ms, max_check_interval_ms,
+                                 self._backoff_factor_value(backoff_factor), jitter)
+        last_completed = None
+        last_reported = None
+
+        while schedule.running():
+            try:
+                # 轮询必须拿到最新状态，不使用短期缓存
+                batch_detail = self.get_batch(batch_id, use_cache=False)
+            except APIError as e:
+                # 被限流或服务暂时不可用时退避后继续轮询
+                if e.status_code not in _THROTTLED_STATUS_CODES:
+                    raise
+                _sleep(schedule.throttled(e.retry_after), stop_event)
+                continue
+
+            # 只在状态变化时回调，批次无进展时不重复输出
+            reported = (batch_detail.status, batch_detail.progress,
+                        batch_detail.completed_files, batch_detail.failed_files)
+            if progress_callback and reported != last_reported:
+                progress_callback(batch_detail)
+            last_reported = reported
+
+            if batch_detail.status in _TERMINAL_BATCH_STATES:
+                return batch_detail
+
+            # 有进展时恢复密集轮询，否则逐步退避
+            if batch_detail.completed_files != last_completed:
+                last_completed = batch_detail.completed_files
+                schedule.reset()
+
+            _sleep(schedule.next_delay(), stop_event)
+
+        raise TimeoutError("Batch timeout")
+
     def get_batches(
         self,
         page: int = 1,
         page_size: int = 20,
         status: Optional[str] = "all",
         sort_by: str = "createdAt",
-        sort_order: str = "desc"
+        sort_order: str = "desc",
+        fields: Optional[Union[str, Iterable[str]]] = None
     ) -> GetBatchesResponse:
         """
         获取用户的批次列表
@@ -368,39 +780,52 @@ class PDFCraftClient:
             status: 状态筛选（默认 "all"）
             sort_by: 排序字段（默认 "createdAt"）
             sort_order: 排序方向（默认 "desc"）
+            fields: 只返回批次的指定字段（例如 ("id", "status", "progress") 或 "id,status,progress"），默认返回全部字段。
+                只用于列表展示等场景，可减少轮询时的响应体积
 
         Returns:
             GetBatchesResponse: 批次列表和分页信息
 
+        Raises:
+            ValueError: status 或 sort_order 不是合法取值
+
         Example:
             ```python
             result = client.get_batches(page=1, page_size=20, status="all")
             print("Total batches:", result.pagination.total)
+
+            # 只获取展示进度所需的字段
+            result = client.get_batches(fields=("id", "status", "progress", "totalFiles"))
             ```
         """
+        if status and status not in _BATCH_STATUS_FILTERS:
+            raise ValueError(f"status must be one of {sorted(_BATCH_STATUS_FILTERS)}")
+        if sort_order not in _SORT_ORDERS:
+            raise ValueError(f"sort_order must be one of {sorted(_SORT_ORDERS)}")
+
+        # 字符串本身也是 Iterable[str]，按逗号分隔的字段列表原样使用，不能逐字符拼接
+        if isinstance(fields, str):
+            fields_param = fields or None
+        else:
+            fields_param = ",".join(fields) if fields else None
+        cache_key = ("batches", page, page_size, status, sort_by, sort_order, fields_param)
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # 值为 None 的参数由 requests 自动省略，其余参数会被正确地 URL 编码
         params = {
-            "page": str(page),
-            "pageSize": str(page_size),
+            "page": page,
+            "pageSize": page_size,
             "status": status,
             "sortBy": sort_by,
-            "sortOrder": sort_order
+            "sortOrder": sort_order,
+            "fields": fields_param
         }
 
-        query_string = "&".join(f"{k}={v}" for k, v in params.items() if v is not None)
-        endpoint = f"{self.batch_base_url}/batches?{query_string}"
-
-        response = requests.get(endpoint, headers=self.headers)
-
-        try:
-            result = response.json()
-        except ValueError:
-            raise APIError(f"Invalid JSON response: {response.text}")
-
-        if not response.ok:
-            raise APIError(f"HTTP {response.status_code}: {response.text}")
+        endpoint = f"{self.batch_base_url}/batches"
 
-        # 处理包装在 data 字段中的响应
-        data_result = result.get("data", result)
+        data_result = self._request_data("GET", endpoint, params=params)
 
         pagination = Pagination(
             page=data_result["pagination"]["page"],
@@ -409,10 +834,12 @@ class PDFCraftClient:
             total_pages=data_result["pagination"]["totalPages"]
         )
 
-        return GetBatchesResponse(
+        batches = GetBatchesResponse(
             batches=data_result["batches"],
             pagination=pagination
         )
+        self._query_cache.set(cache_key, batches)
+        return batches
 
     def get_batch_jobs(
         self,
@@ -433,57 +860,34 @@ class PDFCraftClient:
         Returns:
             GetJobsResponse: 任务列表和分页信息
 
+        Raises:
+            ValueError: status 不是合法取值
+
         Example:
             ```python
             result = client.get_batch_jobs("019aa097-f28d-7000-8d56-6a2987a7b144", status="failed")
             print("Failed jobs:", len(result.jobs))
             ```
         """
+        if status and status not in _JOB_STATUS_FILTERS:
+            raise ValueError(f"status must be one of {sorted(_JOB_STATUS_FILTERS)}")
+
+        cache_key = ("batch_jobs", batch_id, page, page_size, status)
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         params = {
-            "page": str(page),
-            "pageSize": str(page_size)
+            "page": page,
+            "pageSize": page_size,
+            "status": status or None
         }
-        if status:
-            params["status"] = status
 
-        query_string = "&".join(f"{k}={v}" for k, v in params.items())
-        endpoint = f"{self.batch_base_url}/batches/{batch_id}/jobs?{query_string}"
+        endpoint = f"{self.batch_base_url}/batches/{batch_id}/jobs"
 
-        response = requests.get(endpoint, headers=self.headers)
+        data_result = self._request_data("GET", endpoint, params=params)
 
-        try:
-            result = response.json()
-        except ValueError:
-            raise APIError(f"Invalid JSON response: {response.text}")
-
-        if not response.ok:
-            raise APIError(f"HTTP {response.status_code}: {response.text}")
-
-        # 处理包装在 data 字段中的响应
-        data_result = result.get("data", result)
-
-        jobs = [
-            JobDetail(
-                id=job["id"],
-                batch_id=job["batchId"],
-                user_id=job["userId"],
-                output_format=job["outputFormat"],
-                source_url=job["sourceUrl"],
-                file_name=job["fileName"],
-                file_size=job.get("fileSize"),
-                status=job["status"],
-                result_url=job.get("resultUrl"),
-                error_message=job.get("errorMessage"),
-                progress=job.get("progress"),
-                retry_count=job.get("retryCount"),
-                task_id=job.get("taskId"),
-                started_at=job.get("startedAt"),
-                completed_at=job.get("completedAt"),
-                created_at=job["createdAt"],
-                updated_at=job["updatedAt"]
-            )
-            for job in data_result["jobs"]
-        ]
+        jobs = [JobDetail.from_api(job) for job in data_result["jobs"]]
 
         pagination = Pagination(
             page=data_result["pagination"]["page"],
@@ -492,10 +896,46 @@ class PDFCraftClient:
             total_pages=data_result["pagination"]["totalPages"]
         )
 
-        return GetJobsResponse(
+        jobs_response = GetJobsResponse(
             jobs=jobs,
             pagination=pagination
         )
+        self._query_cache.set(cache_key, jobs_response)
+        return jobs_response
+
+    def iter_batch_jobs(
+        self,
+        batch_id: str,
+        status: Optional[str] = "all",
+        page_size: int = 100
+    ) -> Iterator[JobDetail]:
+        """
+        遍历批次中的所有任务，自动翻页
+
+        每次请求获取 page_size 个任务，N 个任务只需 ceil(N / page_size) 次请求。
+
+        Args:
+            batch_id: 批次 ID
+            status: 状态筛选（默认 "all"）
+            page_size: 每页条数（默认 100）
+
+        Returns:
+            Iterator[JobDetail]: 任务详情迭代器
+
+        Example:
+            ```python
+            for job in client.iter_batch_jobs("019aa097-f28d-7000-8d56-6a2987a7b144"):
+                print(job.file_name, job.result_url)
+            ```
+        """
+        page = 1
+        while True:
+            result = self.get_batch_jobs(batch_id, page=page, page_size=page_size, status=status)
+            for job in result.jobs:
+                yield job
+            if page >= result.pagination.total_pages:
+                return
+            page += 1
 
     def cancel_batch(self, batch_id: str) -> OperationResponse:
         """
@@ -513,19 +953,9 @@ class PDFCraftClient:
             print("Cancelled jobs:", result.cancelled_jobs)
             ```
         """
+        self._query_cache.clear()
         endpoint = f"{self.batch_base_url}/batches/{batch_id}/cancel"
-        response = requests.post(endpoint, headers=self.headers)
-
-        try:
-            result = response.json()
-        except ValueError:
-            raise APIError(f"Invalid JSON response: {response.text}")
-
-        if not response.ok:
-            raise APIError(f"HTTP {response.status_code}: {response.text}")
-
-        # 处理包装在 data 字段中的响应
-        data_result = result.get("data", result)
+        data_result = self._request_data("POST", endpoint)
 
         return OperationResponse(
             batch_id=data_result.get("batchId"),
@@ -548,19 +978,9 @@ class PDFCraftClient:
             print("Paused jobs:", result.paused_jobs)
             ```
         """
+        self._query_cache.clear()
         endpoint = f"{self.batch_base_url}/batches/{batch_id}/pause"
-        response = requests.post(endpoint, headers=self.headers)
-
-        try:
-            result = response.json()
-        except ValueError:
-            raise APIError(f"Invalid JSON response: {response.text}")
-
-        if not response.ok:
-            raise APIError(f"HTTP {response.status_code}: {response.text}")
-
-        # 处理包装在 data 字段中的响应
-        data_result = result.get("data", result)
+        data_result = self._request_data("POST", endpoint)
 
         return OperationResponse(
             batch_id=data_result.get("batchId"),
@@ -583,19 +1003,10 @@ class PDFCraftClient:
             print("Resumed jobs:", result.resumed_jobs)
             ```
         """
+        self._terminal_batches.pop(batch_id)
+        self._query_cache.clear()
         endpoint = f"{self.batch_base_url}/batches/{batch_id}/resume"
-        response = requests.post(endpoint, headers=self.headers)
-
-        try:
-            result = response.json()
-        except ValueError:
-            raise APIError(f"Invalid JSON response: {response.text}")
-
-        if not response.ok:
-            raise APIError(f"HTTP {response.status_code}: {response.text}")
-
-        # 处理包装在 data 字段中的响应
-        data_result = result.get("data", result)
+        data_result = self._request_data("POST", endpoint)
 
         return OperationResponse(
             batch_id=data_result.get("batchId"),
@@ -618,19 +1029,11 @@ class PDFCraftClient:
             print("Job status:", result.status)
             ```
         """
+        # 无法得知任务所属批次，重试后所有批次都需要重新查询
+        self._terminal_batches.clear()
+        self._query_cache.clear()
         endpoint = f"{self.batch_base_url}/jobs/{job_id}/retry?force=true"
-        response = requests.post(endpoint, headers=self.headers)
-
-        try:
-            result = response.json()
-        except ValueError:
-            raise APIError(f"Invalid JSON response: {response.text}")
-
-        if not response.ok:
-            raise APIError(f"HTTP {response.status_code}: {response.text}")
-
-        # 处理包装在 data 字段中的响应
-        data_result = result.get("data", result)
+        data_result = self._request_data("POST", endpoint)
 
         return OperationResponse(
             job_id=data_result.get("jobId"),
@@ -653,19 +1056,10 @@ class PDFCraftClient:
             print("Retried jobs:", result.retried_jobs)
             ```
         """
+        self._terminal_batches.pop(batch_id)
+        self._query_cache.clear()
         endpoint = f"{self.batch_base_url}/batches/{batch_id}/retry-failed?force=true"
-        response = requests.post(endpoint, headers=self.headers)
-
-        try:
-            result = response.json()
-        except ValueError:
-            raise APIError(f"Invalid JSON response: {response.text}")
-
-        if not response.ok:
-            raise APIError(f"HTTP {response.status_code}: {response.text}")
-
-        # 处理包装在 data 字段中的响应
-        data_result = result.get("data", result)
+        data_result = self._request_data("POST", endpoint)
 
         return OperationResponse(
             batch_id=data_result.get("batchId"),
@@ -688,19 +1082,9 @@ class PDFCraftClient:
             print("Job status:", result.status)
             ```
         """
+        self._query_cache.clear()
         endpoint = f"{self.batch_base_url}/jobs/{job_id}/cancel"
-        response = requests.post(endpoint, headers=self.headers)
-
-        try:
-            result = response.json()
-        except ValueError:
-            raise APIError(f"Invalid JSON response: {response.text}")
-
-        if not response.ok:
-            raise APIError(f"HTTP {response.status_code}: {response.text}")
-
-        # 处理包装在 data 字段中的响应
-        data_result = result.get("data", result)
+        data_result = self._request_data("POST", endpoint)
 
         return OperationResponse(
             job_id=data_result.get("jobId"),
@@ -720,27 +1104,22 @@ class PDFCraftClient:
             print("Can submit:", status.can_submit_new_job)
             ```
         """
-        endpoint = f"{self.batch_base_url}/concurrent-status"
-        response = requests.get(endpoint, headers=self.headers)
+        cached = self._query_cache.get(("concurrent_status",))
+        if cached is not None:
+            return cached
 
-        try:
-            result = response.json()
-        except ValueError:
-            raise APIError(f"Invalid JSON response: {response.text}")
-
-        if not response.ok:
-            raise APIError(f"HTTP {response.status_code}: {response.text}")
-
-        # 处理包装在 data 字段中的响应
-        data_result = result.get("data", result)
+        endpoint = f"{self.batch_base_url}/concurrent-status"
+        data_result = self._request_data("GET", endpoint)
 
-        return ConcurrentStatus(
+        status = ConcurrentStatus(
             max_concurrent_jobs=data_result["maxConcurrentJobs"],
             current_running_jobs=data_result["currentRunningJobs"],
             can_submit_new_job=data_result.get("canStartNew", data_result.get("canSubmitNewJob", False)),
             available_slots=data_result.get("availableSlots"),
             queued_jobs=data_result.get("queuedJobs")
         )
+        self._query_cache.set(("concurrent_status",), status)
+        return status
 
     # ==================== 文件上传 API 方法 ====================
 
@@ -761,18 +1140,7 @@ class PDFCraftClient:
             "size": file_size
         }
 
-        response = requests.post(endpoint, json=data, headers=self.headers)
-
-        try:
-            result = response.json()
-        except ValueError:
-            raise APIError(f"Invalid JSON response: {response.text}")
-
-        if not response.ok:
-            raise APIError(f"HTTP {response.status_code}: {response.text}")
-
-        # 处理包装在 data 字段中的响应
-        data_result = result.get("data", result)
+        data_result = self._request_data("POST", endpoint, json=data)
 
         return InitUploadResponse(
             upload_id=data_result["upload_id"],
@@ -782,7 +1150,7 @@ class PDFCraftClient:
             presigned_urls=data_result["presigned_urls"]
         )
 
-    def _upload_part(self, presigned_url: str, part_data: bytes, max_retries: int = 3) -> None:
+    def _upload_part(self, presigned_url: str, part_data: Union[bytes, memoryview], max_retries: int = 3) -> None:
         """
         上传单个分片
 
@@ -794,13 +1162,15 @@ class PDFCraftClient:
         Raises:
             APIError: 上传失败
         """
+        # 预签名 URL 自带鉴权信息，不能携带会话默认的 Authorization 头
         headers = {
-            "Content-Type": "application/octet-stream"
+            "Content-Type": "application/octet-stream",
+            "Authorization": None
         }
 
         for attempt in range(max_retries):
             try:
-                response = requests.put(presigned_url, data=part_data, headers=headers)
+                response = self._session.put(presigned_url, data=part_data, headers=headers, timeout=self._upload_timeout)
                 if response.ok:
                     return
                 elif attempt == max_retries - 1:
@@ -822,32 +1192,26 @@ class PDFCraftClient:
             str: 文件的云端缓存 URL（例如 "cache://xxx.pdf"）
         """
         endpoint = f"{self.upload_base_url}/{upload_id}/url"
-        response = requests.get(endpoint, headers=self.headers)
-
-        try:
-            result = response.json()
-        except ValueError:
-            raise APIError(f"Invalid JSON response: {response.text}")
-
-        if not response.ok:
-            raise APIError(f"HTTP {response.status_code}: {response.text}")
-
-        # 处理包装在 data 字段中的响应
-        data_result = result.get("data", result)
+        data_result = self._request_data("GET", endpoint)
 
         return data_result["url"]
 
     def upload_file(self,
                     file_path: str,
                     progress_callback: ProgressCallback = None,
-                    max_retries: int = 3) -> str:
+                    max_retries: int = 3,
+                    max_workers: int = 8) -> str:
         """
         上传 PDF 文件到云端
 
+        分片通过线程池并发上传，进度回调按分片完成的顺序在调用线程中执行，
+        current_part 表示已完成的分片数。
+
         Args:
             file_path: 本地 PDF 文件路径
             progress_callback: 进度回调函数，接收 UploadProgress 对象
             max_retries: 每个分片的最大重试次数（默认 3）
+            max_workers: 同时上传的最大分片数（默认 8）
 
         Returns:
             str: 文件的云端缓存 URL（例如 "cache://xxx.pdf"），可用于后续的转换任务
@@ -869,54 +1233,149 @@ class PDFCraftClient:
             print(f"Upload complete: {cache_url}")
             ```
         """
-        # 检查文件是否存在
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        # 获取文件信息
-        file_size = os.path.getsize(file_path)
-        file_extension = os.path.splitext(file_path)[1]
-        if not file_extension:
-            file_extension = ".pdf"
-
-        # 初始化上传
-        init_response = self._init_upload(file_size, file_extension)
-
-        # 上传分片
-        uploaded_bytes = 0
-        with open(file_path, 'rb') as f:
-            for part_number in range(1, init_response.total_parts + 1):
-                # 跳过已上传的分片
-                if init_response.uploaded_parts and part_number in init_response.uploaded_parts:
-                    uploaded_bytes += init_response.part_size
-                    continue
-
-                # 读取分片数据
-                part_data = f.read(init_response.part_size)
-                if not part_data:
-                    break
+        file_progress_callback = None
+        if progress_callback:
+            file_progress_callback = lambda _, progress: progress_callback(progress)
+
+        return self.upload_files([file_path], file_progress_callback, max_retries, max_workers)[0]
 
-                # 上传分片
-                presigned_url = init_response.presigned_urls.get(str(part_number))
-                if not presigned_url:
-                    raise APIError(f"Missing presigned URL for part {part_number}")
+    def _upload_file_part(self, file_map: Union[mmap.mmap, bytes], offset: int, size: int, presigned_url: str, max_retries: int) -> int:
+        """
+        从文件映射中取出一个分片并上传
+
+        分片以 memoryview 切片直接发送，不复制到新的 bytes 对象；
+        视图在返回前释放，否则映射无法关闭。
+
+        Returns:
+            int: 上传的字节数（分片超出文件末尾时为 0）
+        """
+        with memoryview(file_map) as view, view[offset:offset + size] as part_data:
+            if not part_data:
+                return 0
+            self._upload_part(presigned_url, part_data, max_retries)
+            return len(part_data)
+
+    def upload_files(self,
+                     file_paths: List[str],
+                     progress_callback: FileProgressCallback = None,
+                     max_retries: int = 3,
+                     max_workers: int = 8) -> List[str]:
+        """
+        并发上传多个本地文件
+
+        所有文件的分片共用一个线程池，一个文件的分片上传可以与其他文件的分片上传重叠，
+        上传连接始终保持满载。
+
+        Args:
+            file_paths: 本地文件路径列表
+            progress_callback: 进度回调函数，接收文件路径和该文件的 UploadProgress
+            max_retries: 每个分片的最大重试次数（默认 3）
+            max_workers: 同时上传的最大分片数（默认 8）
+
+        Returns:
+            List[str]: 与 file_paths 顺序一致的云端缓存 URL 列表
 
-                self._upload_part(presigned_url, part_data, max_retries)
+        Raises:
+            APIError: 上传失败
+            FileNotFoundError: 文件不存在
 
-                # 更新进度
-                uploaded_bytes += len(part_data)
-                if progress_callback:
-                    progress = UploadProgress(
-                        uploaded_bytes=uploaded_bytes,
-                        total_bytes=file_size,
-                        current_part=part_number,
-                        total_parts=init_response.total_parts
-                    )
-                    progress_callback(progress)
+        Example:
+            ```python
+            def on_progress(file_path: str, progress: UploadProgress):
+                print(f"{file_path}: {progress.percentage:.2f}%")
 
-        # 获取最终 URL
-        cache_url = self._get_upload_url(init_response.upload_id)
-        return cache_url
+            cache_urls = client.upload_files(["doc1.pdf", "doc2.pdf"], progress_callback=on_progress)
+            ```
+        """
+        # 只 stat 文件获取大小，不打开文件；文件在上传分片时才映射
+        file_sizes = []
+        for file_path in file_paths:
+            try:
+                file_sizes.append(os.path.getsize(file_path))
+            except FileNotFoundError:
+                raise FileNotFoundError(f"File not found: {file_path}")
+
+        # 线程池先于文件映射退出，映射关闭时所有分片都已上传完毕
+        with ExitStack() as file_maps_stack, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # 初始化所有上传
+            init_responses = list(executor.map(
+                lambda args: self._init_upload(args[1], os.path.splitext(args[0])[1] or ".pdf"),
+                zip(file_paths, file_sizes)
+            ))
+
+            # 先确定每个文件待上传分片的偏移量和预签名 URL，缺少 URL 时在开始上传前就失败
+            pending_parts = []
+            uploaded_bytes = []
+            finished_parts = []
+            for index, init_response in enumerate(init_responses):
+                parts = []
+                for part_number in range(1, init_response.total_parts + 1):
+                    # 跳过已上传的分片
+                    if init_response.uploaded_parts and part_number in init_response.uploaded_parts:
+                        continue
+
+                    presigned_url = init_response.presigned_urls.get(str(part_number))
+                    if not presigned_url:
+                        raise APIError(f"Missing presigned URL for part {part_number}")
+
+                    parts.append(((part_number - 1) * init_response.part_size, presigned_url))
+
+                skipped_parts = init_response.total_parts - len(parts)
+                pending_parts.append(parts)
+                uploaded_bytes.append(min(skipped_parts * init_response.part_size, file_sizes[index]))
+                finished_parts.append(skipped_parts)
+
+            # 每个文件只映射一次，其所有分片共享同一个只读映射。同一时间最多映射 max_workers 个文件，
+            # 一个文件的分片全部完成后立即关闭映射并映射下一个文件，上传大量文件时不会耗尽文件描述符
+            files_to_map = iter([index for index, parts in enumerate(pending_parts) if parts])
+            file_stacks = {}
+            remaining_parts = {}
+            futures = {}
+            try:
+                while True:
+                    while len(file_stacks) < max_workers:
+                        index = next(files_to_map, None)
+                        if index is None:
+                            break
+                        file_stack = file_maps_stack.enter_context(ExitStack())
+                        file_map = file_stack.enter_context(_map_file(file_paths[index]))
+                        file_stacks[index] = file_stack
+                        remaining_parts[index] = len(pending_parts[index])
+                        for offset, presigned_url in pending_parts[index]:
+                            future = executor.submit(
+                                self._upload_file_part, file_map, offset, init_responses[index].part_size, presigned_url, max_retries
+                            )
+                            futures[future] = index
+
+                    if not futures:
+                        break
+
+                    done, _ = wait(list(futures), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index = futures.pop(future)
+                        uploaded_bytes[index] += future.result()
+                        finished_parts[index] += 1
+                        remaining_parts[index] -= 1
+                        if remaining_parts[index] == 0:
+                            file_stacks.pop(index).close()
+                        if progress_callback:
+                            progress = UploadProgress(
+                                uploaded_bytes=uploaded_bytes[index],
+                                total_bytes=file_sizes[index],
+                                current_part=finished_parts[index],
+                                total_parts=init_responses[index].total_parts
+                            )
+                            progress_callback(file_paths[index], progress)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+            # 获取最终 URL
+            return list(executor.map(
+                lambda init_response: self._get_upload_url(init_response.upload_id),
+                init_responses
+            ))
 
     def convert_local_pdf(self,
                          file_path: str,
@@ -931,7 +1390,9 @@ class PDFCraftClient:
                          max_check_interval_ms: int = 5000,
                          backoff_factor: Union[float, PollingStrategy] = PollingStrategy.EXPONENTIAL,
                          progress_callback: ProgressCallback = None,
-                         upload_max_retries: int = 3) -> Union[str, Dict[str, Any]]:
+                         upload_max_retries: int = 3,
+                         stop_event: Optional[threading.Event] = None,
+                         jitter: float = 0.2) -> Union[str, Dict[str, Any]]:
         """
         上传本地 PDF 文件并进行转换（便捷方法）
 
@@ -949,6 +1410,8 @@ class PDFCraftClient:
             backoff_factor: 轮询间隔增长因子或 PollingStrategy，默认指数增长
             progress_callback: 上传进度回调函数
             upload_max_retries: 上传分片的最大重试次数，默认 3
+            stop_event: 可选的 threading.Event，设置后不再提交转换并立即停止等待（进行中的上传会先完成）
+            jitter: 每次轮询间隔的随机抖动比例（默认 0.2，即 ±20%），为 0 时不抖动
 
         Returns:
             如果 wait 为 True，返回下载 URL (str)
@@ -957,6 +1420,7 @@ class PDFCraftClient:
         Raises:
             FileNotFoundError: 文件不存在
             APIError: 上传或转换失败
+            CancelledError: stop_event 被设置
 
         Example:
             ```python
@@ -975,6 +1439,9 @@ class PDFCraftClient:
             print(f"Download URL: {download_url}")
             ```
         """
+        if stop_event is not None and stop_event.is_set():
+            raise CancelledError("Conversion cancelled")
+
         # 先上传文件
         cache_url = self.upload_file(file_path, progress_callback, upload_max_retries)
 
@@ -990,5 +1457,135 @@ class PDFCraftClient:
             max_wait_ms=max_wait_ms,
             check_interval_ms=check_interval_ms,
             max_check_interval_ms=max_check_interval_ms,
-            backoff_factor=backoff_factor
+            backoff_factor=backoff_factor,
+            stop_event=stop_event,
+            jitter=jitter
+        )
+
+    def convert_files(self,
+                      file_paths: List[str],
+                      output_format: Union[str, FormatType] = FormatType.MARKDOWN,
+                      includes_footnotes: bool = False,
+                      upload_max_retries: int = 3,
+                      max_workers: int = 8) -> CreateBatchResponse:
+        """
+        上传多个本地文件并作为一个批次进行转换（便捷方法）
+
+        文件通过 upload_files 并发上传后，只需一次 create_batch 和一次 start_batch 调用即可提交全部文件，
+        而不是为每个文件单独提交转换任务。
+
+        Args:
+            file_paths: 本地 PDF 文件路径列表
+            output_format: 输出格式（默认 "markdown"）
+            includes_footnotes: 是否包含脚注引用（默认 False）
+            upload_max_retries: 上传分片的最大重试次数，默认 3
+            max_workers: 同时上传的最大分片数，默认 8
+
+        Returns:
+            CreateBatchResponse: create_batch 返回的批次信息。返回时批次已经启动，
+                但 status 仍是创建时的状态；需要最新状态时使用 get_batch 或 wait_for_batch
+
+        Raises:
+            FileNotFoundError: 文件不存在
+            APIError: 上传、创建或启动批次失败
+
+        Example:
+            ```python
+            batch = client.convert_files(["doc1.pdf", "doc2.pdf"])
+            print("Batch ID:", batch.batch_id)
+            ```
+        """
+        if not file_paths:
+            raise ValueError("file_paths must not be empty")
+
+        cache_urls = self.upload_files(file_paths, max_retries=upload_max_retries, max_workers=max_workers)
+
+        # 直接构建请求所需的字典，create_batch 无需再逐个转换 BatchFile
+        files = [
+            {"url": cache_url, "fileName": os.path.basename(file_path)}
+            for file_path, cache_url in zip(file_paths, cache_urls)
+        ]
+
+        batch = self.create_batch(files, output_format, includes_footnotes)
+        # start_batch 的响应只包含排队的任务数，批次状态以后续 get_batch 查询为准
+        self.start_batch(batch.batch_id)
+        return batch
+
+    # ==================== 异步 API 方法 ====================
+    # 以下方法是 AsyncPDFCraftClient 的薄封装，新代码建议直接使用 AsyncPDFCraftClient
+
+    def _as_async(self):
+        # 延迟导入，async_client 模块依赖本模块
+        from .async_client import AsyncPDFCraftClient
+        return AsyncPDFCraftClient.from_client(self)
+
+    async def await_for_completion(self,
+                                   task_id: str,
+                                   format_type: Union[str, FormatType] = FormatType.MARKDOWN,
+                                   max_wait_ms: int = 7200000,
+                                   check_interval_ms: int = 1000,
+                                   max_check_interval_ms: int = 5000,
+                                   backoff_factor: Union[float, PollingStrategy] = PollingStrategy.EXPONENTIAL,
+                                   jitter: float = 0.2) -> str:
+        """
+        wait_for_completion 的异步版本，等同于 AsyncPDFCraftClient.wait_for_completion
+
+        Example:
+            ```python
+            urls = await asyncio.gather(
+                *(client.await_for_completion(task_id) for task_id in task_ids),
+                return_exceptions=True
+            )
+            ```
+        """
+        return await self._as_async().wait_for_completion(
+            task_id,
+            format_type,
+            max_wait_ms,
+            check_interval_ms,
+            max_check_interval_ms,
+            backoff_factor,
+            jitter
+        )
+
+    async def aconvert_local_pdf(self,
+                                 file_path: str,
+                                 format_type: Union[str, FormatType] = FormatType.MARKDOWN,
+                                 model: str = "gundam",
+                                 includes_footnotes: bool = False,
+                                 ignore_pdf_errors: bool = True,
+                                 ignore_ocr_errors: bool = True,
+                                 wait: bool = True,
+                                 max_wait_ms: int = 7200000,
+                                 check_interval_ms: int = 1000,
+                                 max_check_interval_ms: int = 5000,
+                                 backoff_factor: Union[float, PollingStrategy] = PollingStrategy.EXPONENTIAL,
+                                 progress_callback: ProgressCallback = None,
+                                 upload_max_retries: int = 3,
+                                 jitter: float = 0.2) -> str:
+        """
+        convert_local_pdf 的异步版本，等同于 AsyncPDFCraftClient.convert_local_pdf
+
+        Example:
+            ```python
+            task_ids = await asyncio.gather(
+                *(client.aconvert_local_pdf(f, wait=False) for f in ["a.pdf", "b.pdf"])
+            )
+            ```
+        """
+        return await self._as_async().convert_local_pdf(
+            file_path,
+            format_type,
+            model,
+            includes_footnotes,
+            ignore_pdf_errors,
+            ignore_ocr_errors,
+            wait,
+            max_wait_ms,
+            check_interval_ms,
+            max_check_interval_ms,
+            backoff_factor,
+            progress_callback,
+            upload_max_retries,
+            jitter
         )
@@ -6,6 +6,7 @@ class FormatType(Enum):
 
 class PollingStrategy(Enum):
     EXPONENTIAL = 1.5
+    GENTLE = 1.3
     FIXED = 1.0
     AGGRESSIVE = 2.0
 
@@ -1,11 +1,23 @@
+from typing import Optional
+
 class PDFCraftError(Exception):
     """Base exception for PDF Craft SDK"""
     pass
 
 class APIError(PDFCraftError):
     """Raised when API returns an error"""
-    pass
+
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        # HTTP status code of the response, if the error came from one
+        self.status_code = status_code
+        # Seconds the server asked us to wait (Retry-After header), if any
+        self.retry_after = retry_after
 
 class TimeoutError(PDFCraftError):
     """Raised when conversion times out"""
     pass
+
+class CancelledError(PDFCraftError):
+    """Raised when a wait is cancelled through its stop_event"""
+    pass
@@ -1,7 +1,8 @@
 """上传相关的类型定义"""
 
+import functools
 from typing import Dict, Optional, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -27,14 +28,25 @@ class UploadProgress:
     total_bytes: int
     current_part: int
     total_parts: int
+    percentage: float = field(init=False)
+    """上传进度百分比 (0-100)，创建时计算一次"""
 
-    @property
-    def percentage(self) -> float:
-        """返回上传进度百分比 (0-100)"""
-        if self.total_bytes == 0:
-            return 0.0
-        return (self.uploaded_bytes / self.total_bytes) * 100
+    def __post_init__(self):
+        self.percentage = (self.uploaded_bytes / self.total_bytes) * 100 if self.total_bytes else 0.0
+
+    def render_bar(self, width: int = 30) -> str:
+        """返回宽度为 width 个字符的文本进度条，例如 "██████░░░░" """
+        filled = min(width, int(width * self.percentage / 100))
+        return _progress_bar(filled, width)
+
+
+@functools.lru_cache(maxsize=256)
+def _progress_bar(filled: int, width: int) -> str:
+    return "█" * filled + "░" * (width - filled)
 
 
 # 进度回调函数类型
 ProgressCallback = Optional[Callable[[UploadProgress], None]]
+
+# 多文件上传的进度回调函数类型，接收文件路径和该文件的 UploadProgress
+FileProgressCallback = Optional[Callable[[str, UploadProgress], None]]
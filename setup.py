@@ -18,7 +18,12 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests>=2.25.0",
+        # Retry(allowed_methods=...) 需要 urllib3 1.26+
+        "urllib3>=1.26.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.0.0"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",